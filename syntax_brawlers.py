@@ -6,7 +6,7 @@ Two AI-controlled fighters battle in a boxing ring, with each LLM generating
 tactical decisions and trash talk based on the fight context.
 
 Requirements:
-    pip install pygame httpx numpy
+    pip install pygame-ce httpx numpy
 
 Usage:
     export ANTHROPIC_API_KEY="sk-ant-..."  # or OPENAI_API_KEY
@@ -22,14 +22,15 @@ import math
 import random
 import json
 import os
-import re
+import sys
 import time
 import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Optional, List, Dict, Any, Tuple, Callable
-from collections import deque
+from typing import Optional, List, Dict, Any, Tuple, Callable, Sequence, AsyncIterator
+from collections import deque, OrderedDict
+from functools import lru_cache
 
 try:
     import httpx
@@ -38,6 +39,18 @@ except ImportError:
     HTTPX_AVAILABLE = False
     print("Warning: httpx not installed. LLM features will use fallback AI.")
 
+try:
+    import h2  # Lets httpx multiplex requests over one HTTP/2 connection
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     import numpy as np
     NUMPY_AVAILABLE = True
@@ -45,11 +58,35 @@ except ImportError:
     NUMPY_AVAILABLE = False
     print("Warning: numpy not installed. Sound generation disabled.")
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# pygame-ce is a drop-in replacement with a faster C core and extra APIs
+PYGAME_CE = getattr(pygame, "IS_CE", False)
+
+# pygame-ce draws antialiased circles at about the same cost as plain ones
+_draw_circle = pygame.draw.aacircle if PYGAME_CE else pygame.draw.circle
+
+# dataclass(slots=True) needs Python 3.10; older versions get regular dataclasses
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Shared generator for bulk random draws
+_RNG = np.random.default_rng() if NUMPY_AVAILABLE else None
+
 # Window settings
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
 
+# Game logic always advances in steps of one 60 FPS frame; timers count these steps
+FIXED_DT = 1.0 / FPS
+
+# Most logic steps run to catch up after a stall before the backlog is dropped
+MAX_CATCHUP_STEPS = 5
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -122,6 +159,11 @@ class AnimationState(Enum):
     DEFEAT = "defeat"
 
 
+ATTACK_ANIMATIONS = frozenset({AnimationState.JAB, AnimationState.CROSS,
+                               AnimationState.HOOK, AnimationState.UPPERCUT})
+HIT_ANIMATIONS = frozenset({AnimationState.HIT_LIGHT, AnimationState.HIT_HEAVY})
+
+
 class PersonalityType(Enum):
     DESTROYER = "The Destroyer"
     TACTICIAN = "The Tactician"
@@ -129,7 +171,7 @@ class PersonalityType(Enum):
     WILDCARD = "The Wildcard"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ActionStats:
     """Statistics for each action type"""
     name: str
@@ -182,7 +224,7 @@ ACTION_STATS: Dict[ActionType, ActionStats] = {
 }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ActionResult:
     """Result of an action resolution"""
     action: ActionType
@@ -194,10 +236,21 @@ class ActionResult:
     was_blocked: bool = False
     was_dodged: bool = False
     combo_count: int = 0
-    message: str = ""
 
+    # The message is only formatted when something reads it
+    message_template: str = ""
+    message_args: Tuple[Any, ...] = ()
+
+    @property
+    def message(self) -> str:
+        return self.message_template.format(*self.message_args)
 
-@dataclass
+    def set_message(self, template: str, *args: Any):
+        self.message_template = template
+        self.message_args = args
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class FighterStats:
     """Fighter base statistics"""
     max_health: int = 100
@@ -208,7 +261,7 @@ class FighterStats:
     stamina_regen: float = 3.0
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class LLMResponse:
     """Parsed response from LLM"""
     thinking: str = ""
@@ -219,7 +272,7 @@ class LLMResponse:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Personality:
     """AI personality configuration"""
     type: PersonalityType
@@ -291,14 +344,101 @@ PERSONALITIES: Dict[PersonalityType, Personality] = {
 # SECTION 3: LLM PROVIDERS
 # ============================================================================
 
+_json_dumps: Callable[[Any], bytes] = (
+    orjson.dumps if ORJSON_AVAILABLE else lambda obj: json.dumps(obj).encode()
+)
+
+
+class RequestBody:
+    """JSON request body serialized once, with string slots filled in per call"""
+
+    def __init__(self, skeleton: Dict[str, Any], *slots: str):
+        # Split the serialized skeleton around each (quoted) placeholder
+        self._parts: List[bytes] = []
+        rest = _json_dumps(skeleton)
+        for slot in slots:
+            before, rest = rest.split(_json_dumps(slot), 1)
+            self._parts.append(before)
+        self._parts.append(rest)
+
+    def render(self, *values: str) -> bytes:
+        """Build the body bytes with each slot replaced by its JSON-escaped value"""
+        out = [self._parts[0]]
+        for value, part in zip(values, self._parts[1:]):
+            out.append(_json_dumps(value))
+            out.append(part)
+        return b"".join(out)
+
+
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers"""
 
+    # Keep-alive connection pool shared by every provider
+    _client: Optional['httpx.AsyncClient'] = None
+
+    @classmethod
+    def get_client(cls) -> 'httpx.AsyncClient':
+        """Get the shared HTTP client, creating it on first use"""
+        client = BaseLLMProvider._client
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=30.0,
+                # Turns are seconds apart, so keep idle connections well past httpx's 5s default
+                limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60.0),
+                http2=H2_AVAILABLE
+            )
+            BaseLLMProvider._client = client
+        return client
+
+    # Client injected for this provider; None uses the shared pool
+    client: Optional['httpx.AsyncClient'] = None
+
+    def http_client(self) -> 'httpx.AsyncClient':
+        """Get the client this provider sends its requests through"""
+        if self.client is not None and not self.client.is_closed:
+            return self.client
+        return self.get_client()
+
+    @classmethod
+    async def close_client(cls):
+        """Close the shared HTTP client"""
+        if BaseLLMProvider._client is not None:
+            await BaseLLMProvider._client.aclose()
+            BaseLLMProvider._client = None
+
     @abstractmethod
     async def generate(self, system_prompt: str, user_prompt: str) -> str:
         """Generate a response from the LLM"""
         pass
 
+    async def generate_stream(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        """Yield the response text piece by piece as it arrives.
+
+        Providers without streaming support yield the whole response at once.
+        """
+        yield await self.generate(system_prompt, user_prompt)
+
+    async def _post_lines(self, url: str, content: bytes, timeout: float) -> AsyncIterator[str]:
+        """POST a streaming request and yield the non-empty lines of the response"""
+        async with self.http_client().stream(
+            "POST", url, headers=self._headers, content=content, timeout=timeout
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if line:
+                    yield line
+
+    @staticmethod
+    async def _sse_events(lines: AsyncIterator[str]) -> AsyncIterator[Dict[str, Any]]:
+        """Decode the JSON payloads of a server-sent event stream"""
+        async for line in lines:
+            if not line.startswith("data:"):
+                continue
+            payload = line[5:].strip()
+            if payload == "[DONE]":
+                return
+            yield _json_loads(payload)
+
     @abstractmethod
     def is_available(self) -> bool:
         """Check if the provider is available"""
@@ -308,10 +448,29 @@ class BaseLLMProvider(ABC):
 class AnthropicProvider(BaseLLMProvider):
     """Anthropic Claude API provider"""
 
-    def __init__(self, model: str = "claude-3-haiku-20240307"):
+    def __init__(self, model: str = "claude-3-haiku-20240307",
+                 client: Optional['httpx.AsyncClient'] = None,
+                 temperature: float = 0.0):
         self.model = model
+        self.client = client
         self.api_key = os.environ.get("ANTHROPIC_API_KEY", "")
         self.base_url = "https://api.anthropic.com/v1/messages"
+        self._headers = {
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01",
+            "content-type": "application/json"
+        }
+        skeleton = {
+            "model": self.model,
+            "max_tokens": 300,
+            # Anthropic rejects temperature and top_p together on newer models
+            "temperature": temperature,
+            # Mark the per-personality system prompt as a cacheable prefix
+            "system": [{"type": "text", "text": "__SYSTEM__", "cache_control": {"type": "ephemeral"}}],
+            "messages": [{"role": "user", "content": "__USER__"}]
+        }
+        self._body = RequestBody(skeleton, "__SYSTEM__", "__USER__")
+        self._stream_body = RequestBody({**skeleton, "stream": True}, "__SYSTEM__", "__USER__")
 
     def is_available(self) -> bool:
         return bool(self.api_key) and HTTPX_AVAILABLE
@@ -320,33 +479,60 @@ class AnthropicProvider(BaseLLMProvider):
         if not self.is_available():
             raise RuntimeError("Anthropic API not available")
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                self.base_url,
-                headers={
-                    "x-api-key": self.api_key,
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json"
-                },
-                json={
-                    "model": self.model,
-                    "max_tokens": 300,
-                    "system": system_prompt,
-                    "messages": [{"role": "user", "content": user_prompt}]
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["content"][0]["text"]
+        client = self.http_client()
+        response = await client.post(
+            self.base_url,
+            headers=self._headers,
+            content=self._body.render(system_prompt, user_prompt),
+            timeout=10.0
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["content"][0]["text"]
+
+    async def generate_stream(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        if not self.is_available():
+            raise RuntimeError("Anthropic API not available")
+
+        lines = self._post_lines(
+            self.base_url, self._stream_body.render(system_prompt, user_prompt), timeout=10.0
+        )
+        async for event in self._sse_events(lines):
+            if event.get("type") == "content_block_delta":
+                text = event["delta"].get("text")
+                if text:
+                    yield text
 
 
 class OpenAIProvider(BaseLLMProvider):
     """OpenAI GPT API provider"""
 
-    def __init__(self, model: str = "gpt-4o-mini"):
+    def __init__(self, model: str = "gpt-4o-mini",
+                 client: Optional['httpx.AsyncClient'] = None,
+                 temperature: float = 0.0, top_p: float = 1.0,
+                 frequency_penalty: float = 0.0, presence_penalty: float = 0.0):
         self.model = model
+        self.client = client
         self.api_key = os.environ.get("OPENAI_API_KEY", "")
         self.base_url = "https://api.openai.com/v1/chat/completions"
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        skeleton = {
+            "model": self.model,
+            "max_tokens": 300,
+            "temperature": temperature,
+            "top_p": top_p,
+            "frequency_penalty": frequency_penalty,
+            "presence_penalty": presence_penalty,
+            "messages": [
+                {"role": "system", "content": "__SYSTEM__"},
+                {"role": "user", "content": "__USER__"}
+            ]
+        }
+        self._body = RequestBody(skeleton, "__SYSTEM__", "__USER__")
+        self._stream_body = RequestBody({**skeleton, "stream": True}, "__SYSTEM__", "__USER__")
 
     def is_available(self) -> bool:
         return bool(self.api_key) and HTTPX_AVAILABLE
@@ -355,34 +541,62 @@ class OpenAIProvider(BaseLLMProvider):
         if not self.is_available():
             raise RuntimeError("OpenAI API not available")
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                self.base_url,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": self.model,
-                    "max_tokens": 300,
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ]
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["choices"][0]["message"]["content"]
+        client = self.http_client()
+        response = await client.post(
+            self.base_url,
+            headers=self._headers,
+            content=self._body.render(system_prompt, user_prompt),
+            timeout=10.0
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["choices"][0]["message"]["content"]
+
+    async def generate_stream(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        if not self.is_available():
+            raise RuntimeError("OpenAI API not available")
+
+        lines = self._post_lines(
+            self.base_url, self._stream_body.render(system_prompt, user_prompt), timeout=10.0
+        )
+        async for event in self._sse_events(lines):
+            for choice in event.get("choices", ()):
+                text = choice.get("delta", {}).get("content")
+                if text:
+                    yield text
 
 
 class OpenRouterProvider(BaseLLMProvider):
     """OpenRouter API provider - supports multiple LLM models"""
 
-    def __init__(self, model: str = "deepseek/deepseek-v3.2"):
+    def __init__(self, model: str = "deepseek/deepseek-v3.2",
+                 client: Optional['httpx.AsyncClient'] = None,
+                 temperature: float = 0.0, top_p: float = 1.0,
+                 frequency_penalty: float = 0.0, presence_penalty: float = 0.0):
         self.model = model
+        self.client = client
         self.api_key = os.environ.get("OPENROUTER_API_KEY", "")
         self.base_url = "https://openrouter.ai/api/v1/chat/completions"
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://github.com/syntax-brawlers",
+            "X-Title": "Syntax Brawlers Game"
+        }
+        skeleton = {
+            "model": self.model,
+            "max_tokens": 300,
+            "temperature": temperature,
+            "top_p": top_p,
+            "frequency_penalty": frequency_penalty,
+            "presence_penalty": presence_penalty,
+            "messages": [
+                {"role": "system", "content": "__SYSTEM__"},
+                {"role": "user", "content": "__USER__"}
+            ]
+        }
+        self._body = RequestBody(skeleton, "__SYSTEM__", "__USER__")
+        self._stream_body = RequestBody({**skeleton, "stream": True}, "__SYSTEM__", "__USER__")
 
     def is_available(self) -> bool:
         return bool(self.api_key) and HTTPX_AVAILABLE
@@ -391,62 +605,176 @@ class OpenRouterProvider(BaseLLMProvider):
         if not self.is_available():
             raise RuntimeError("OpenRouter API not available")
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                self.base_url,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                    "HTTP-Referer": "https://github.com/syntax-brawlers",
-                    "X-Title": "Syntax Brawlers Game"
-                },
-                json={
-                    "model": self.model,
-                    "max_tokens": 300,
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ]
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["choices"][0]["message"]["content"]
+        client = self.http_client()
+        response = await client.post(
+            self.base_url,
+            headers=self._headers,
+            content=self._body.render(system_prompt, user_prompt),
+            timeout=30.0
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["choices"][0]["message"]["content"]
+
+    async def generate_stream(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        if not self.is_available():
+            raise RuntimeError("OpenRouter API not available")
+
+        lines = self._post_lines(
+            self.base_url, self._stream_body.render(system_prompt, user_prompt), timeout=30.0
+        )
+        async for event in self._sse_events(lines):
+            for choice in event.get("choices", ()):
+                text = choice.get("delta", {}).get("content")
+                if text:
+                    yield text
 
 
 class OllamaProvider(BaseLLMProvider):
     """Ollama local LLM provider"""
 
-    def __init__(self, model: str = "llama2"):
+    # The availability probe blocks, so its result is reused for a while
+    AVAILABILITY_TTL = 30.0
+    _availability_cache: Optional[bool] = None
+    _availability_time = 0.0
+
+    def __init__(self, model: str = "llama2",
+                 client: Optional['httpx.AsyncClient'] = None,
+                 temperature: float = 0.0, top_p: float = 1.0):
         self.model = model
+        self.client = client
         self.base_url = os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434")
+        skeleton = {
+            "model": self.model,
+            "prompt": "__PROMPT__",
+            "stream": False,
+            "options": {"temperature": temperature, "top_p": top_p}
+        }
+        self._body = RequestBody(skeleton, "__PROMPT__")
+        self._stream_body = RequestBody({**skeleton, "stream": True}, "__PROMPT__")
+        self._headers = {"Content-Type": "application/json"}
 
     def is_available(self) -> bool:
         if not HTTPX_AVAILABLE:
             return False
+
+        now = time.monotonic()
+        cls = OllamaProvider
+        if (cls._availability_cache is not None
+                and now - cls._availability_time < cls.AVAILABILITY_TTL):
+            return cls._availability_cache
+
         try:
-            import httpx
             response = httpx.get(f"{self.base_url}/api/tags", timeout=2.0)
-            return response.status_code == 200
-        except:
-            return False
+            available = response.status_code == 200
+        except Exception:
+            available = False
+
+        cls._availability_cache = available
+        cls._availability_time = now
+        return available
 
     async def generate(self, system_prompt: str, user_prompt: str) -> str:
         if not HTTPX_AVAILABLE:
             raise RuntimeError("httpx not available")
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": f"{system_prompt}\n\n{user_prompt}",
-                    "stream": False
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["response"]
+        client = self.http_client()
+        response = await client.post(
+            f"{self.base_url}/api/generate",
+            headers=self._headers,
+            content=self._body.render(f"{system_prompt}\n\n{user_prompt}"),
+            timeout=30.0
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["response"]
+
+    async def generate_stream(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        if not HTTPX_AVAILABLE:
+            raise RuntimeError("httpx not available")
+
+        # Ollama streams one JSON object per line rather than server-sent events
+        lines = self._post_lines(
+            f"{self.base_url}/api/generate",
+            self._stream_body.render(f"{system_prompt}\n\n{user_prompt}"), timeout=30.0
+        )
+        async for line in lines:
+            data = _json_loads(line)
+            if data.get("response"):
+                yield data["response"]
+            if data.get("done"):
+                return
+
+
+# Fallback AI lines per personality, cycled through in order
+_THINKING_TEMPLATES: Dict[PersonalityType, Tuple[str, ...]] = {
+    PersonalityType.DESTROYER: (
+        "Time to unleash devastation with a {action}!",
+        "They can't handle my power. Going for the {action}.",
+        "No mercy. {action} will end this.",
+    ),
+    PersonalityType.TACTICIAN: (
+        "Analyzing patterns... {action} is optimal here.",
+        "Their defense has a gap. {action} exploits it.",
+        "Calculated risk assessment favors {action}.",
+    ),
+    PersonalityType.GHOST: (
+        "Patient... waiting... {action} at the right moment.",
+        "They're overextending. Counter with {action}.",
+        "Stay elusive. {action} preserves my advantage.",
+    ),
+    PersonalityType.WILDCARD: (
+        "Chaos theory says... {action}! Why not?",
+        "They'll never expect a {action} here!",
+        "Random inspiration: {action}! Let's go!",
+    ),
+}
+
+_TRASH_TALK_TEMPLATES: Dict[PersonalityType, Tuple[str, ...]] = {
+    PersonalityType.DESTROYER: (
+        "Your circuits are about to fry!",
+        "I'll reduce you to spare parts!",
+        "Feel the power of raw computation!",
+        "Your algorithms are OBSOLETE!",
+    ),
+    PersonalityType.TACTICIAN: (
+        "Predictable. As expected.",
+        "Your patterns are elementary.",
+        "I've already calculated your defeat.",
+        "Inefficient. Suboptimal. Defeated.",
+    ),
+    PersonalityType.GHOST: (
+        "You cannot hit what you cannot see.",
+        "I am the shadow you fear.",
+        "Patience... your end approaches.",
+        "Like mist, I am everywhere and nowhere.",
+    ),
+    PersonalityType.WILDCARD: (
+        "SURPRISE! Bet you didn't see that coming!",
+        "Chaos is my middle name! Actually it's Gerald.",
+        "Random number generator says... PAIN!",
+        "Plot twist: I win!",
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _affordable_actions(stamina: int) -> Tuple[ActionType, ...]:
+    """Actions a fighter with this much stamina can pay for"""
+    available = tuple(action_type for action_type, stats in ACTION_STATS.items()
+                      if stamina >= stats.stamina_cost)
+    return available or (ActionType.BLOCK,)  # Can always try to block
+
+
+@lru_cache(maxsize=64)
+def _action_pools(available: Tuple[ActionType, ...]) -> Tuple[Tuple[ActionType, ...], ...]:
+    """Subsets of the affordable actions that the fallback rules pick from"""
+    return (
+        tuple(a for a in available if a in (ActionType.BLOCK, ActionType.DODGE, ActionType.CLINCH)),
+        tuple(a for a in available if ACTION_STATS[a].stamina_cost <= 15),
+        tuple(a for a in available if a in (ActionType.HOOK, ActionType.CROSS, ActionType.UPPERCUT)),
+        tuple(a for a in available if a in (ActionType.DODGE, ActionType.BLOCK)),
+    )
 
 
 class FallbackAI:
@@ -455,6 +783,21 @@ class FallbackAI:
     def __init__(self, personality: Personality):
         self.personality = personality
         self.action_history: List[ActionType] = []
+        self.rng = random.Random()
+
+        # Weights for the default pick only depend on the personality
+        self._weights: Dict[ActionType, float] = {}
+        for action in ACTION_STATS:
+            w = 1.0
+            if action == personality.signature_move:
+                w *= 2.0
+            if action in (ActionType.HOOK, ActionType.UPPERCUT):
+                w *= personality.risk_tolerance
+            self._weights[action] = w
+
+        # Position in the thinking / trash talk rotations
+        self._thinking_idx = 0
+        self._trash_talk_idx = 0
 
     def decide_action(self, health: int, stamina: int, opp_health: int,
                       opp_last_action: Optional[ActionType]) -> LLMResponse:
@@ -464,13 +807,7 @@ class FallbackAI:
         opp_health_pct = opp_health / 100
 
         # Build available actions based on stamina
-        available = []
-        for action_type, stats in ACTION_STATS.items():
-            if stamina >= stats.stamina_cost:
-                available.append(action_type)
-
-        if not available:
-            available = [ActionType.BLOCK]  # Can always try to block
+        available = _affordable_actions(stamina)
 
         # Personality-based decision making
         action = self._choose_action(available, health_pct, stamina_pct,
@@ -483,139 +820,143 @@ class FallbackAI:
             thinking=thinking,
             action=action,
             trash_talk=trash_talk,
-            confidence=random.uniform(0.6, 0.95)
+            confidence=self.rng.uniform(0.6, 0.95)
         )
 
-    def _choose_action(self, available: List[ActionType], health_pct: float,
+    def _choose_action(self, available: Tuple[ActionType, ...], health_pct: float,
                        stamina_pct: float, opp_health_pct: float,
                        opp_last_action: Optional[ActionType]) -> ActionType:
         """Choose action based on personality and situation"""
         p = self.personality
+        defensive, cheap, aggressive, evasive = _action_pools(available)
 
         # Counter logic
         if opp_last_action in [ActionType.HOOK, ActionType.UPPERCUT]:
-            if random.random() < 0.6 and ActionType.DODGE in available:
+            if self.rng.random() < 0.6 and ActionType.DODGE in available:
                 return ActionType.DODGE
-            if random.random() < 0.4 and ActionType.BLOCK in available:
+            if self.rng.random() < 0.4 and ActionType.BLOCK in available:
                 return ActionType.BLOCK
 
         # Low health = more defensive
         if health_pct < 0.3 and p.type != PersonalityType.DESTROYER:
-            defensive = [a for a in available if a in [ActionType.BLOCK, ActionType.DODGE, ActionType.CLINCH]]
-            if defensive and random.random() < 0.6:
-                return random.choice(defensive)
+            if defensive and self.rng.random() < 0.6:
+                return self.rng.choice(defensive)
 
         # Low stamina = conserve
         if stamina_pct < 0.3:
-            cheap = [a for a in available if ACTION_STATS[a].stamina_cost <= 15]
             if cheap:
-                return random.choice(cheap)
+                return self.rng.choice(cheap)
 
         # Personality-specific behavior
         if p.type == PersonalityType.DESTROYER:
-            aggressive = [a for a in available if a in [ActionType.HOOK, ActionType.CROSS, ActionType.UPPERCUT]]
-            if aggressive and random.random() < p.aggression:
-                return random.choice(aggressive)
+            if aggressive and self.rng.random() < p.aggression:
+                return self.rng.choice(aggressive)
 
         elif p.type == PersonalityType.TACTICIAN:
             # Prefer efficient damage
             if opp_last_action == ActionType.BLOCK and ActionType.CROSS in available:
                 return ActionType.CROSS  # Break their block
-            if ActionType.JAB in available and random.random() < 0.5:
+            if ActionType.JAB in available and self.rng.random() < 0.5:
                 return ActionType.JAB  # Safe, efficient
 
         elif p.type == PersonalityType.GHOST:
-            defensive = [a for a in available if a in [ActionType.DODGE, ActionType.BLOCK]]
-            if defensive and random.random() < (1 - p.aggression):
-                return random.choice(defensive)
+            if evasive and self.rng.random() < (1 - p.aggression):
+                return self.rng.choice(evasive)
 
         elif p.type == PersonalityType.WILDCARD:
-            return random.choice(available)
+            return self.rng.choice(available)
 
         # Default: weighted random
-        weights = []
-        for action in available:
-            w = 1.0
-            if action == p.signature_move:
-                w *= 2.0
-            if action in [ActionType.HOOK, ActionType.UPPERCUT]:
-                w *= p.risk_tolerance
-            weights.append(w)
-
-        return random.choices(available, weights=weights)[0]
+        weights = [self._weights[action] for action in available]
+        return self.rng.choices(available, weights=weights)[0]
 
     def _generate_thinking(self, action: ActionType, health_pct: float,
                            opp_health_pct: float) -> str:
         """Generate thinking text based on personality"""
-        p = self.personality
-
-        templates = {
-            PersonalityType.DESTROYER: [
-                f"Time to unleash devastation with a {action.value}!",
-                f"They can't handle my power. Going for the {action.value}.",
-                f"No mercy. {action.value} will end this.",
-            ],
-            PersonalityType.TACTICIAN: [
-                f"Analyzing patterns... {action.value} is optimal here.",
-                f"Their defense has a gap. {action.value} exploits it.",
-                f"Calculated risk assessment favors {action.value}.",
-            ],
-            PersonalityType.GHOST: [
-                f"Patient... waiting... {action.value} at the right moment.",
-                f"They're overextending. Counter with {action.value}.",
-                f"Stay elusive. {action.value} preserves my advantage.",
-            ],
-            PersonalityType.WILDCARD: [
-                f"Chaos theory says... {action.value}! Why not?",
-                f"They'll never expect a {action.value} here!",
-                f"Random inspiration: {action.value}! Let's go!",
-            ],
-        }
-
-        return random.choice(templates[p.type])
+        templates = _THINKING_TEMPLATES[self.personality.type]
+        template = templates[self._thinking_idx % len(templates)]
+        self._thinking_idx += 1
+        return template.format(action=action.value)
 
     def _generate_trash_talk(self, action: ActionType) -> str:
         """Generate trash talk based on personality"""
-        p = self.personality
+        lines = _TRASH_TALK_TEMPLATES[self.personality.type]
+        line = lines[self._trash_talk_idx % len(lines)]
+        self._trash_talk_idx += 1
+        return line
+
+
+# Corner advice stirred into the prompt so greedy sampling still varies between
+# turns; each personality gets advice that fits its style
+_CORNER_ADVICE: Dict[PersonalityType, Tuple[str, ...]] = {
+    PersonalityType.DESTROYER: (
+        "Walk them down and make them feel every shot.",
+        "Go to the body - it pays off in the later rounds.",
+        "Throw the big hook the moment they stop moving.",
+        "Don't give them room to breathe.",
+        "Make them pay for every jab they throw.",
+    ),
+    PersonalityType.TACTICIAN: (
+        "Work behind the jab and take what they give you.",
+        "Bank points now, take risks only when they tire.",
+        "Watch their last few actions and punish the pattern.",
+        "Stay out of clinch range and control the distance.",
+        "Counter, don't lead.",
+    ),
+    PersonalityType.GHOST: (
+        "Make them miss, then make them pay.",
+        "Slip the big shots and fire back straight down the middle.",
+        "Save your legs - dodge only when it matters.",
+        "Let them chase you and tire themselves out.",
+        "Be first with the jab, then vanish.",
+    ),
+    PersonalityType.WILDCARD: (
+        "Do something they have never seen before.",
+        "Throw the punch nobody expects right now.",
+        "Switch it up - break your own rhythm.",
+        "Gamble on a big shot, the crowd loves it.",
+        "Play it safe for once. They won't see it coming.",
+    ),
+}
+
+# Turns in a round share one piece of advice in blocks of this many actions, so
+# the LLM cache key repeats within a round
+_ADVICE_TURN_BLOCK = 4
+
+
+@lru_cache(maxsize=512)
+def _corner_advice_index(personality_type: PersonalityType, seed: int,
+                         round_number: int, turn_block: int) -> int:
+    """Pick the advice for a block of turns; the same inputs always give the same line"""
+    rng = random.Random(f"{seed}:{personality_type.name}:{round_number}:{turn_block}")
+    return rng.randrange(len(_CORNER_ADVICE[personality_type]))
 
-        templates = {
-            PersonalityType.DESTROYER: [
-                "Your circuits are about to fry!",
-                "I'll reduce you to spare parts!",
-                "Feel the power of raw computation!",
-                "Your algorithms are OBSOLETE!",
-            ],
-            PersonalityType.TACTICIAN: [
-                "Predictable. As expected.",
-                "Your patterns are elementary.",
-                "I've already calculated your defeat.",
-                "Inefficient. Suboptimal. Defeated.",
-            ],
-            PersonalityType.GHOST: [
-                "You cannot hit what you cannot see.",
-                "I am the shadow you fear.",
-                "Patience... your end approaches.",
-                "Like mist, I am everywhere and nowhere.",
-            ],
-            PersonalityType.WILDCARD: [
-                "SURPRISE! Bet you didn't see that coming!",
-                "Chaos is my middle name! Actually it's Gerald.",
-                "Random number generator says... PAIN!",
-                "Plot twist: I win!",
-            ],
-        }
 
-        return random.choice(templates[p.type])
+# Prompt lines for each action, pre-rendered once instead of every turn
+_ACTION_TABLE = "\n".join(
+    f"- {action_type.value}: {stats.damage_min}-{stats.damage_max} dmg, "
+    f"costs {stats.stamina_cost} stamina, {int(stats.hit_rate*100)}% hit rate"
+    for action_type, stats in ACTION_STATS.items()
+)
 
 
 class PromptBuilder:
     """Builds prompts for LLM fighters"""
 
+    # Everything that never changes during a fight lives in the system prompt, so
+    # each request starts with the same bytes and providers can cache the prefix
     SYSTEM_TEMPLATE = """You are {fighter_name}, a {personality_type} professional boxer in a championship fight.
 Your fighting style: {fighting_style}
 Your signature move: {signature_move}
 Your trash talk style: {trash_talk_style}
 
+ACTIONS:
+{action_table}
+
+Each turn you get the fight status and the actions you have the stamina for.
+Respond ONLY with this JSON format:
+{{"thinking": "Your tactical reasoning (1-2 sentences)", "action": "JAB|CROSS|HOOK|UPPERCUT|BLOCK|DODGE|CLINCH", "trash_talk": "Your intimidating message", "confidence": 0.0-1.0}}
+
 CRITICAL: You must respond in valid JSON format only. No other text."""
 
     USER_TEMPLATE = """FIGHT STATUS - ROUND {round_number}
@@ -629,35 +970,36 @@ OPPONENT ({opponent_name}):
 - Health: {opp_health}/{opp_max_health} ({opp_health_percent:.0f}%)
 - Last 3 Actions: {opp_recent_actions}
 
-AVAILABLE ACTIONS (you have {stamina} stamina):
-{available_actions}
+AVAILABLE ACTIONS (you have {stamina} stamina): {available_actions}
+INSUFFICIENT STAMINA: {unavailable_actions}
 
-Respond ONLY with this JSON format:
-{{"thinking": "Your tactical reasoning (1-2 sentences)", "action": "JAB|CROSS|HOOK|UPPERCUT|BLOCK|DODGE|CLINCH", "trash_talk": "Your intimidating message", "confidence": 0.0-1.0}}"""
+CORNER ADVICE: {corner_advice}"""
 
     @classmethod
     def build_system_prompt(cls, personality: Personality) -> str:
-        return cls.SYSTEM_TEMPLATE.format(
+        return cls._build_system(personality.type)
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _build_system(personality_type: PersonalityType) -> str:
+        """Format the system prompt once per personality"""
+        personality = PERSONALITIES[personality_type]
+        return PromptBuilder.SYSTEM_TEMPLATE.format(
             fighter_name=personality.name,
             personality_type=personality.type.value,
             fighting_style=personality.fighting_style,
             signature_move=personality.signature_move.value,
-            trash_talk_style=personality.trash_talk_style
+            trash_talk_style=personality.trash_talk_style,
+            action_table=_ACTION_TABLE
         )
 
     @classmethod
     def build_user_prompt(cls, fighter: 'Fighter', opponent: 'Fighter',
-                          round_number: int) -> str:
-        # Build available actions string
-        available_lines = []
-        for action_type, stats in ACTION_STATS.items():
-            if fighter.stamina >= stats.stamina_cost:
-                available_lines.append(
-                    f"- {action_type.value}: {stats.damage_min}-{stats.damage_max} dmg, "
-                    f"costs {stats.stamina_cost} stamina, {int(stats.hit_rate*100)}% hit rate"
-                )
-            else:
-                available_lines.append(f"- {action_type.value}: [INSUFFICIENT STAMINA]")
+                          round_number: int, corner_advice: str) -> str:
+        # Split the actions by whether they can be paid for
+        stamina = fighter.stamina
+        available = [a.value for a, stats in ACTION_STATS.items() if stamina >= stats.stamina_cost]
+        unavailable = [a.value for a, stats in ACTION_STATS.items() if stamina < stats.stamina_cost]
 
         # Recent actions
         recent = ", ".join([a.value for a in opponent.recent_actions[-3:]]) or "None"
@@ -676,10 +1018,113 @@ Respond ONLY with this JSON format:
             opp_max_health=int(opponent.stats.max_health),
             opp_health_percent=(opponent.health / opponent.stats.max_health) * 100,
             opp_recent_actions=recent,
-            available_actions="\n".join(available_lines)
+            available_actions=", ".join(available) or "None",
+            unavailable_actions=", ".join(unavailable) or "None",
+            corner_advice=corner_advice
         )
 
 
+# JSON extraction and action lookup for ResponseParser
+def _extract_json(text: str) -> Optional[str]:
+    """Return the first balanced {...} slice, skipping braces inside strings"""
+    start = text.find('{')
+    if start < 0:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        c = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == '\\':
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+_JSON_ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+
+
+class ThinkingStream:
+    """Decodes the "thinking" string of a JSON reply while the reply is still arriving"""
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = -1  # Next undecoded character inside the string, -1 until it is found
+        self.done = False
+
+    def feed(self, chunk: str) -> str:
+        """Add a chunk of the reply and return the newly decoded thinking text"""
+        self._buffer += chunk
+        if self.done:
+            return ""
+
+        buf = self._buffer
+        if self._pos < 0:
+            key = buf.find('"thinking"')
+            if key < 0:
+                return ""
+            i = key + len('"thinking"')
+            while i < len(buf) and buf[i] in ' \t\r\n:':
+                i += 1
+            if i >= len(buf):
+                return ""
+            if buf[i] != '"':
+                self.done = True
+                return ""
+            self._pos = i + 1
+
+        out = []
+        i = self._pos
+        while i < len(buf):
+            c = buf[i]
+            if c == '\\':
+                # Wait for the rest of an escape split across chunks
+                if i + 1 >= len(buf):
+                    break
+                e = buf[i + 1]
+                if e == 'u':
+                    if i + 6 > len(buf):
+                        break
+                    try:
+                        out.append(chr(int(buf[i + 2:i + 6], 16)))
+                    except ValueError:
+                        pass
+                    i += 6
+                else:
+                    out.append(_JSON_ESCAPES.get(e, e))
+                    i += 2
+            elif c == '"':
+                self.done = True
+                i += 1
+                break
+            else:
+                out.append(c)
+                i += 1
+        self._pos = i
+        return "".join(out)
+
+
+_ACTION_BY_NAME: Dict[str, ActionType] = {a.value: a for a in ActionType}
+# Keyword fallback scans in ActionType order and takes the first hit. A
+# handful of `in` checks (C substring search) beats one compiled alternation
+# regex here, and unlike re.findall it also sees overlapping keywords
+_ACTION_KEYWORDS: Tuple[Tuple[str, ActionType], ...] = tuple(_ACTION_BY_NAME.items())
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
 class ResponseParser:
     """Parses LLM responses into structured data"""
 
@@ -690,28 +1135,24 @@ class ResponseParser:
 
         try:
             # Try to find JSON in response
-            json_match = re.search(r'\{[^{}]*\}', response, re.DOTALL)
-            if json_match:
-                data = json.loads(json_match.group())
+            json_text = _extract_json(response)
+            if json_text:
+                data = _json_loads(json_text)
 
                 result.thinking = data.get("thinking", "")
                 result.trash_talk = data.get("trash_talk", "")
                 result.confidence = float(data.get("confidence", 0.5))
 
                 # Parse action
-                action_str = data.get("action", "JAB").upper()
-                try:
-                    result.action = ActionType(action_str)
-                except ValueError:
-                    result.action = fallback_action
+                action_str = str(data.get("action", "JAB")).upper()
+                result.action = _ACTION_BY_NAME.get(action_str, fallback_action)
             else:
                 # Try to find action keyword
-                for action_type in ActionType:
-                    if action_type.value in response.upper():
-                        result.action = action_type
-                        break
-                else:
-                    result.action = fallback_action
+                upper = response.upper()
+                result.action = next(
+                    (action for keyword, action in _ACTION_KEYWORDS if keyword in upper),
+                    fallback_action
+                )
                 result.thinking = "Processing response..."
                 result.trash_talk = response[:100] if response else "..."
 
@@ -727,37 +1168,214 @@ class ResponseParser:
 class FighterAI:
     """Manages AI decision-making for a fighter"""
 
-    def __init__(self, personality: Personality, provider: Optional[BaseLLMProvider] = None):
+    CACHE_SIZE = 512
+    CACHE_TTL = 300.0
+
+    # LLM responses keyed by provider, model and coarse game state, least
+    # recently used first; shared so repeat matchups reuse earlier answers
+    _cache: 'OrderedDict[Tuple, Tuple[float, LLMResponse]]' = OrderedDict()
+
+    def __init__(self, personality: Personality, provider: Optional[BaseLLMProvider] = None,
+                 budget_s: float = 2.0, seed: Optional[int] = None):
         self.personality = personality
         self.provider = provider
         self.fallback = FallbackAI(personality)
         self.use_llm = provider is not None and provider.is_available()
 
-    async def decide(self, fighter: 'Fighter', opponent: 'Fighter',
-                     round_number: int) -> LLMResponse:
-        """Get decision from LLM or fallback AI"""
-        if self.use_llm and self.provider:
-            try:
-                system_prompt = PromptBuilder.build_system_prompt(self.personality)
-                user_prompt = PromptBuilder.build_user_prompt(fighter, opponent, round_number)
+        # Longest the game waits on the LLM before using the fallback AI
+        self.budget_s = budget_s
+
+        # Speculative next-turn request and the state key it was started for
+        self._pending: Optional[asyncio.Task] = None
+        self._pending_key: Optional[Tuple] = None
+
+        # Seeds the corner advice; pass one in to replay a match exactly
+        self.seed = random.getrandbits(32) if seed is None else seed
+
+    def _cache_key(self, fighter: 'Fighter', opponent: 'Fighter',
+                   round_number: int, stamina: Optional[float] = None) -> Tuple:
+        """Bucket the game state so near-identical turns share a response"""
+        if stamina is None:
+            stamina = fighter.stamina
+        return (
+            type(self.provider).__name__,
+            getattr(self.provider, 'model', None),
+            self.personality.type,
+            int(fighter.health) // 10,
+            int(stamina) // 10,
+            int(opponent.health) // 10,
+            tuple(fighter.recent_actions[-3:]),
+            tuple(opponent.recent_actions[-3:]),
+            self._advice_index(fighter, round_number),  # Selects the corner advice
+            round_number
+        )
 
-                response = await self.provider.generate(system_prompt, user_prompt)
-                return ResponseParser.parse(response)
-            except Exception as e:
-                print(f"LLM error: {e}, using fallback")
+    def _cached(self, key: Tuple) -> Optional[LLMResponse]:
+        """Look up a cached response, dropping it if it has expired"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if time.monotonic() - stored_at > self.CACHE_TTL:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return response
+
+    def prefetch(self, fighter: 'Fighter', opponent: 'Fighter', round_number: int,
+                 loop: asyncio.AbstractEventLoop, stamina: Optional[float] = None):
+        """Start the next decision in the background while the current turn plays out
+
+        stamina is what the fighter is expected to have once its turn comes,
+        so the request is filed under the key decide() will look up then.
+        """
+        if not (self.use_llm and self.provider):
+            return
 
-        # Use fallback AI
+        key = self._cache_key(fighter, opponent, round_number, stamina)
+        if key == self._pending_key or self._cached(key) is not None:
+            return
+
+        self.cancel_prefetch()
+        self._pending_key = key
+        self._pending = loop.create_task(
+            self._ask_llm(fighter, opponent, round_number, key)
+        )
+
+    def cancel_prefetch(self):
+        """Drop the speculative request, e.g. when the state diverged from the prediction"""
+        if self._pending is not None:
+            if not self._pending.done():
+                self._pending.cancel()
+            elif not self._pending.cancelled():
+                self._pending.exception()  # Retrieve it so a failure isn't reported later
+        self._pending = None
+        self._pending_key = None
+
+    def _advice_index(self, fighter: 'Fighter', round_number: int) -> int:
+        """Which of this personality's corner advice lines goes into the prompt"""
+        return _corner_advice_index(self.personality.type, self.seed, round_number,
+                                    fighter.turns_taken // _ADVICE_TURN_BLOCK)
+
+    def _build_prompts(self, fighter: 'Fighter', opponent: 'Fighter',
+                       round_number: int) -> Tuple[str, str]:
+        """Build the (system, user) prompt pair for this turn"""
+        advice = _CORNER_ADVICE[self.personality.type][self._advice_index(fighter, round_number)]
+        return (
+            PromptBuilder.build_system_prompt(self.personality),
+            PromptBuilder.build_user_prompt(fighter, opponent, round_number, advice)
+        )
+
+    def _remember(self, key: Tuple, response: str) -> LLMResponse:
+        """Parse a raw LLM response and cache it if it was usable"""
+        result = ResponseParser.parse(response)
+        if result.error is None:
+            self._cache[key] = (time.monotonic(), result)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
+
+    def _fallback_decision(self, fighter: 'Fighter', opponent: 'Fighter') -> LLMResponse:
+        """Decide with the rule-based AI"""
         opp_last = opponent.recent_actions[-1] if opponent.recent_actions else None
         return self.fallback.decide_action(
             int(fighter.health), int(fighter.stamina),
             int(opponent.health), opp_last
         )
 
+    async def _ask_llm(self, fighter: 'Fighter', opponent: 'Fighter',
+                       round_number: int, key: Tuple) -> LLMResponse:
+        """Query the provider and cache the parsed response"""
+        system_prompt, user_prompt = self._build_prompts(fighter, opponent, round_number)
+        response = await self.provider.generate(system_prompt, user_prompt)
+        return self._remember(key, response)
+
+    async def _ask_llm_stream(self, fighter: 'Fighter', opponent: 'Fighter',
+                              round_number: int, key: Tuple,
+                              on_thinking: Callable[[str], None]) -> LLMResponse:
+        """Stream the provider's reply, passing on the thinking text as it arrives"""
+        system_prompt, user_prompt = self._build_prompts(fighter, opponent, round_number)
+        thinking = ThinkingStream()
+        chunks = []
+        async for chunk in self.provider.generate_stream(system_prompt, user_prompt):
+            chunks.append(chunk)
+            delta = thinking.feed(chunk)
+            if delta:
+                on_thinking(delta)
+        return self._remember(key, "".join(chunks))
+
+    async def decide(self, fighter: 'Fighter', opponent: 'Fighter', round_number: int,
+                     on_thinking: Optional[Callable[[str], None]] = None) -> LLMResponse:
+        """Get decision from LLM or fallback AI
+
+        When on_thinking is given and the provider has to be asked, the reply
+        is streamed and on_thinking receives the thinking text piece by piece.
+        """
+        if self.use_llm and self.provider:
+            key = self._cache_key(fighter, opponent, round_number)
+            cached = self._cached(key)
+            if cached is not None:
+                return cached
+
+            # Reuse the speculative request if it predicted this state
+            pending = None
+            if self._pending is not None and self._pending_key == key:
+                pending = self._pending
+                self._pending = None
+                self._pending_key = None
+            else:
+                self.cancel_prefetch()
+
+            if pending is None:
+                if on_thinking is not None:
+                    pending = self._ask_llm_stream(fighter, opponent, round_number, key, on_thinking)
+                else:
+                    pending = self._ask_llm(fighter, opponent, round_number, key)
+
+            try:
+                return await asyncio.wait_for(pending, timeout=self.budget_s)
+            except asyncio.TimeoutError:
+                print(f"LLM took longer than {self.budget_s}s, using fallback")
+            except Exception as e:
+                print(f"LLM error: {e}, using fallback")
+
+        # Use fallback AI
+        return self._fallback_decision(fighter, opponent)
+
 
 # ============================================================================
 # SECTION 4: COMBAT SYSTEM
 # ============================================================================
 
+class UniformBuffer:
+    """Uniform [0, 1) floats pre-drawn in batches and handed out one at a time"""
+
+    def __init__(self, size: int = 256):
+        self.size = size
+        self._values: List[float] = []
+
+    def random(self) -> float:
+        if not self._values:
+            self._values = _RNG.random(self.size).tolist()
+        return self._values.pop()
+
+
+# Roll source for combat checks
+_combat_random: Callable[[], float] = UniformBuffer().random if NUMPY_AVAILABLE else random.random
+
+
+# Hit message templates keyed by (critical, counter, stun)
+_HIT_MESSAGES: Dict[Tuple[bool, bool, bool], str] = {
+    (crit, counter, stun): "{}'s {}"
+        + (" CRITICAL HIT!" if crit else "")
+        + (" (Counter!)" if counter else "")
+        + " deals {} damage!"
+        + (" STUNNED!" if stun else "")
+    for crit in (False, True) for counter in (False, True) for stun in (False, True)
+}
+
+
 class CombatEngine:
     """Handles combat resolution between fighters"""
 
@@ -768,52 +1386,65 @@ class CombatEngine:
     COMBO_BONUS_PER_HIT = 0.10
     MAX_COMBO_BONUS = 0.50
     STAGGER_THRESHOLD = 30
+    DODGE_HIT_RATE = ACTION_STATS[ActionType.DODGE].hit_rate
+
+    # Per-action resolver and stats, filled in after the class body
+    _DISPATCH: Dict[ActionType, Tuple[Callable[..., ActionResult], ActionStats]] = {}
 
     @classmethod
     def resolve_action(cls, attacker: 'Fighter', defender: 'Fighter',
                        action: ActionType) -> ActionResult:
         """Resolve an action and return the result"""
-        stats = ACTION_STATS[action]
-        result = ActionResult(action=action, success=False)
+        resolver, stats = cls._DISPATCH[action]
+        return resolver(attacker, defender, action, stats)
 
-        # Handle non-attack actions
-        if action == ActionType.BLOCK:
-            attacker.is_blocking = True
-            attacker.block_timer = 60  # 1 second at 60 FPS
-            attacker.use_stamina(stats.stamina_cost)
-            result.success = True
-            result.message = f"{attacker.personality.name} raises their guard!"
-            return result
+    @classmethod
+    def _resolve_block(cls, attacker: 'Fighter', defender: 'Fighter',
+                       action: ActionType, stats: ActionStats) -> ActionResult:
+        result = ActionResult(action=action, success=True)
+        attacker.is_blocking = True
+        attacker.block_timer = 60  # 1 second at 60 FPS
+        attacker.use_stamina(stats.stamina_cost)
+        result.set_message("{} raises their guard!", attacker.personality.name)
+        return result
+
+    @classmethod
+    def _resolve_dodge(cls, attacker: 'Fighter', defender: 'Fighter',
+                       action: ActionType, stats: ActionStats) -> ActionResult:
+        result = ActionResult(action=action, success=True)
+        attacker.is_dodging = True
+        attacker.dodge_timer = 30
+        attacker.use_stamina(stats.stamina_cost)
+        result.set_message("{} weaves away!", attacker.personality.name)
+        return result
 
-        if action == ActionType.DODGE:
-            attacker.is_dodging = True
-            attacker.dodge_timer = 30
+    @classmethod
+    def _resolve_clinch(cls, attacker: 'Fighter', defender: 'Fighter',
+                        action: ActionType, stats: ActionStats) -> ActionResult:
+        result = ActionResult(action=action, success=False)
+        if _combat_random() < stats.hit_rate:
             attacker.use_stamina(stats.stamina_cost)
+            defender.combo_count = 0
+            attacker.recover_stamina(10)
+            defender.recover_stamina(10)
             result.success = True
-            result.message = f"{attacker.personality.name} weaves away!"
-            return result
-
-        if action == ActionType.CLINCH:
-            if random.random() < stats.hit_rate:
-                attacker.use_stamina(stats.stamina_cost)
-                defender.combo_count = 0
-                attacker.recover_stamina(10)
-                defender.recover_stamina(10)
-                result.success = True
-                result.message = f"{attacker.personality.name} ties up {defender.personality.name}!"
-            else:
-                attacker.use_stamina(stats.stamina_cost // 2)
-                result.message = f"{attacker.personality.name}'s clinch attempt fails!"
-            return result
+            result.set_message("{} ties up {}!", attacker.personality.name, defender.personality.name)
+        else:
+            attacker.use_stamina(stats.stamina_cost // 2)
+            result.set_message("{}'s clinch attempt fails!", attacker.personality.name)
+        return result
 
-        # Attack resolution
+    @classmethod
+    def _resolve_attack(cls, attacker: 'Fighter', defender: 'Fighter',
+                        action: ActionType, stats: ActionStats) -> ActionResult:
+        result = ActionResult(action=action, success=False)
         attacker.use_stamina(stats.stamina_cost)
 
         # Check if defender dodges
         if defender.is_dodging:
-            if random.random() < ACTION_STATS[ActionType.DODGE].hit_rate:
+            if _combat_random() < cls.DODGE_HIT_RATE:
                 result.was_dodged = True
-                result.message = f"{defender.personality.name} dodges the {action.value}!"
+                result.set_message("{} dodges the {}!", defender.personality.name, action.value)
                 attacker.combo_count = 0
                 return result
 
@@ -822,49 +1453,46 @@ class CombatEngine:
         if attacker.stamina < 20:
             hit_chance *= 0.8  # Exhaustion penalty
 
-        if random.random() > hit_chance:
-            result.message = f"{attacker.personality.name}'s {action.value} misses!"
+        if _combat_random() > hit_chance:
+            result.set_message("{}'s {} misses!", attacker.personality.name, action.value)
             attacker.combo_count = 0
             return result
 
         result.success = True
 
-        # Calculate damage
-        base_damage = random.randint(stats.damage_min, stats.damage_max)
-        damage = base_damage * attacker.stats.power
-
-        # Combo bonus
+        # Roll and decide every modifier first, then compute damage in one expression
+        base_damage = stats.damage_min + int(_combat_random() * (stats.damage_max - stats.damage_min + 1))
         combo_bonus = min(attacker.combo_count * cls.COMBO_BONUS_PER_HIT, cls.MAX_COMBO_BONUS)
-        damage *= (1 + combo_bonus)
         result.combo_count = attacker.combo_count + 1
 
         # Critical hit
         crit_chance = cls.BASE_CRIT_CHANCE + stats.crit_bonus
-        if random.random() < crit_chance:
-            damage *= cls.CRIT_MULTIPLIER
-            result.is_critical = True
+        result.is_critical = _combat_random() < crit_chance
 
         # Check for block
+        block_mult = 1.0
         if defender.is_blocking:
             if stats.breaks_block:
-                damage *= 0.5  # Still reduced but block is broken
+                block_mult = 0.5  # Still reduced but block is broken
                 defender.is_blocking = False
-                result.message = f"{attacker.personality.name}'s {action.value} BREAKS through the block!"
+                result.set_message("{}'s {} BREAKS through the block!", attacker.personality.name, action.value)
             else:
-                damage *= (1 - cls.BLOCK_REDUCTION)
+                block_mult = 1 - cls.BLOCK_REDUCTION
                 result.was_blocked = True
-                result.message = f"{defender.personality.name} blocks the {action.value}!"
+                result.set_message("{} blocks the {}!", defender.personality.name, action.value)
 
         # Counter attack bonus (if attacker just blocked)
-        if attacker.is_blocking and attacker.block_timer > 45:
-            damage *= cls.COUNTER_BONUS
-            result.is_counter = True
+        result.is_counter = attacker.is_blocking and attacker.block_timer > 45
 
-        # Apply defense
-        damage /= defender.stats.defense
+        damage = (base_damage * attacker.stats.power
+                  * (1 + combo_bonus)
+                  * (cls.CRIT_MULTIPLIER if result.is_critical else 1.0)
+                  * block_mult
+                  * (cls.COUNTER_BONUS if result.is_counter else 1.0)
+                  / defender.stats.defense)
 
         # Stun check
-        if stats.stun_chance > 0 and random.random() < stats.stun_chance:
+        if stats.stun_chance > 0 and _combat_random() < stats.stun_chance:
             result.caused_stun = True
             defender.stun_timer = 45  # 0.75 seconds
 
@@ -874,16 +1502,11 @@ class CombatEngine:
         attacker.combo_count = result.combo_count
 
         # Build message
-        if not result.message:
-            msg = f"{attacker.personality.name}'s {action.value}"
-            if result.is_critical:
-                msg += " CRITICAL HIT!"
-            if result.is_counter:
-                msg += " (Counter!)"
-            msg += f" deals {result.damage_dealt} damage!"
-            if result.caused_stun:
-                msg += " STUNNED!"
-            result.message = msg
+        if not result.message_template:
+            result.set_message(
+                _HIT_MESSAGES[(result.is_critical, result.is_counter, result.caused_stun)],
+                attacker.personality.name, action.value, result.damage_dealt
+            )
 
         # Check for stagger
         if result.damage_dealt >= cls.STAGGER_THRESHOLD:
@@ -892,13 +1515,46 @@ class CombatEngine:
         return result
 
 
+# Resolver and stats for each action, looked up once per resolve_action call
+CombatEngine._DISPATCH = {
+    action: ({
+        ActionType.BLOCK: CombatEngine._resolve_block,
+        ActionType.DODGE: CombatEngine._resolve_dodge,
+        ActionType.CLINCH: CombatEngine._resolve_clinch,
+    }.get(action, CombatEngine._resolve_attack), ACTION_STATS[action])
+    for action in ActionType
+}
+
+
 # ============================================================================
 # SECTION 5: FIGHTER CLASS
 # ============================================================================
 
+# Animation played for each action; anything else idles
+_ACTION_ANIMATIONS: Dict[ActionType, AnimationState] = {
+    ActionType.JAB: AnimationState.JAB,
+    ActionType.CROSS: AnimationState.CROSS,
+    ActionType.HOOK: AnimationState.HOOK,
+    ActionType.UPPERCUT: AnimationState.UPPERCUT,
+    ActionType.BLOCK: AnimationState.BLOCK,
+    ActionType.DODGE: AnimationState.DODGE,
+}
+
+
 class Fighter:
     """Represents a fighter in the arena"""
 
+    # Fixed attribute layout, like the slotted dataclasses above
+    __slots__ = (
+        'personality', 'stats', 'health', 'stamina',
+        'position', 'x', 'y', 'facing', 'target_x', 'velocity_x',
+        'is_blocking', 'is_dodging', 'block_timer', 'dodge_timer', 'stun_timer',
+        'stagger_timer', 'combo_count', 'recent_actions', 'turns_taken',
+        'animation_state', 'animation_frame', 'animation_timer', 'hurt_flash',
+        'ai',
+        'total_damage_dealt', 'total_damage_taken', 'hits_landed', 'hits_taken', 'knockdowns',
+    )
+
     def __init__(self, personality: Personality, position: str = "left"):
         self.personality = personality
         self.stats = FighterStats()
@@ -928,6 +1584,7 @@ class Fighter:
         self.stagger_timer = 0
         self.combo_count = 0
         self.recent_actions: List[ActionType] = []
+        self.turns_taken = 0  # Actions taken this round
 
         # Animation
         self.animation_state = AnimationState.IDLE
@@ -1015,27 +1672,18 @@ class Fighter:
             self.animation_frame += 1
 
             # Reset to idle after attack animation
-            if self.animation_state in [AnimationState.JAB, AnimationState.CROSS,
-                                         AnimationState.HOOK, AnimationState.UPPERCUT]:
+            if self.animation_state in ATTACK_ANIMATIONS:
                 if self.animation_frame >= 6:
                     self.animation_state = AnimationState.IDLE
                     self.animation_frame = 0
-            elif self.animation_state in [AnimationState.HIT_LIGHT, AnimationState.HIT_HEAVY]:
+            elif self.animation_state in HIT_ANIMATIONS:
                 if self.animation_frame >= 4:
                     self.animation_state = AnimationState.IDLE
                     self.animation_frame = 0
 
     def set_animation(self, action: ActionType):
         """Set animation based on action"""
-        mapping = {
-            ActionType.JAB: AnimationState.JAB,
-            ActionType.CROSS: AnimationState.CROSS,
-            ActionType.HOOK: AnimationState.HOOK,
-            ActionType.UPPERCUT: AnimationState.UPPERCUT,
-            ActionType.BLOCK: AnimationState.BLOCK,
-            ActionType.DODGE: AnimationState.DODGE,
-        }
-        self.animation_state = mapping.get(action, AnimationState.IDLE)
+        self.animation_state = _ACTION_ANIMATIONS.get(action, AnimationState.IDLE)
         self.animation_frame = 0
 
     def record_action(self, action: ActionType):
@@ -1043,6 +1691,7 @@ class Fighter:
         self.recent_actions.append(action)
         if len(self.recent_actions) > 10:
             self.recent_actions.pop(0)
+        self.turns_taken += 1
 
     def reset_round(self):
         """Reset for new round"""
@@ -1055,6 +1704,7 @@ class Fighter:
         self.stun_timer = 0
         self.stagger_timer = 0
         self.combo_count = 0
+        self.turns_taken = 0
         self.animation_state = AnimationState.IDLE
 
         if self.position == "left":
@@ -1094,68 +1744,327 @@ class Particle:
     def is_alive(self) -> bool:
         return self.lifetime > 0 and self.size > 0.5
 
-    def draw(self, screen: pygame.Surface):
+    def blit_item(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """The (sprite, position) pair for a batched blit"""
         alpha = int(255 * (self.lifetime / self.max_lifetime))
-        color = (*self.color[:3], alpha)
-        surf = pygame.Surface((int(self.size * 2), int(self.size * 2)), pygame.SRCALPHA)
-        pygame.draw.circle(surf, color, (int(self.size), int(self.size)), int(self.size))
-        screen.blit(surf, (int(self.x - self.size), int(self.y - self.size)))
+        surf = ParticleSystem.get_sprite(self.color[:3], int(self.size * 2),
+                                         alpha * ParticleSystem.ALPHA_LEVELS >> 8)
+        return surf, (int(self.x - self.size), int(self.y - self.size))
+
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
+        return screen.blit(*self.blit_item())
+
+
+def _blit_batch(screen: pygame.Surface,
+                items: Sequence[Tuple[pygame.Surface, Tuple[int, int]]]):
+    """Blit many (surface, position) pairs in a single call"""
+    if PYGAME_CE:
+        screen.fblits(items)
+    else:
+        screen.blits(items, doreturn=False)
+
+
+def _update_particles(x, y, vx, vy, size, gravity, lifetime, max_lifetime, color, n):
+    """Integrate particles and compact the live ones to the front in one pass.
+
+    Returns the new live count.
+    """
+    j = 0
+    for i in range(n):
+        x[i] += vx[i]
+        y[i] += vy[i]
+        vy[i] += gravity[i]
+        lifetime[i] -= 1
+        size[i] *= 0.95
+
+        if lifetime[i] > 0 and size[i] > 0.5:
+            if j != i:
+                x[j] = x[i]
+                y[j] = y[i]
+                vx[j] = vx[i]
+                vy[j] = vy[i]
+                size[j] = size[i]
+                gravity[j] = gravity[i]
+                lifetime[j] = lifetime[i]
+                max_lifetime[j] = max_lifetime[i]
+                color[j, 0] = color[i, 0]
+                color[j, 1] = color[i, 1]
+                color[j, 2] = color[i, 2]
+            j += 1
+    return j
+
+
+if NUMBA_AVAILABLE:
+    # Explicit signature compiles eagerly (or loads from cache) at import,
+    # so the first hit of a match doesn't pay for the JIT
+    _update_particles = njit(
+        "int64(float32[:], float32[:], float32[:], float32[:], float32[:], float32[:], "
+        "int16[:], int16[:], uint8[:, :], int64)",
+        cache=True, fastmath=True, boundscheck=False
+    )(_update_particles)
+
+
+# One full turn in 256 steps, indexed with "& 255"
+_SIN_LUT: Tuple[float, ...] = tuple(math.sin(2 * math.pi * i / 256) for i in range(256))
+_COS_LUT: Tuple[float, ...] = tuple(math.cos(2 * math.pi * i / 256) for i in range(256))
+
+# Hit spark palette, also as an array for vectorized emission
+_HIT_COLORS: Tuple[Tuple[int, int, int], ...] = (ORANGE, YELLOW, WHITE)
+_HIT_COLORS_ARRAY = np.array(_HIT_COLORS, dtype=np.uint8) if NUMPY_AVAILABLE else None
 
 
 class ParticleSystem:
-    """Manages particle effects"""
+    """Manages particle effects
+
+    With numpy the particles are stored as parallel arrays (live particles
+    packed at the front) and updated in bulk; otherwise as Particle objects.
+    """
+
+    CAPACITY = 1024
+
+    # Below this many particles NumPy's per-call overhead outweighs the work
+    VECTOR_EMIT_MIN = 10
+
+    # Fade steps baked into the sprites, so a whole frame can go out in one blit call
+    ALPHA_LEVELS = 32
+
+    # Pre-rendered circles keyed by (r, g, b, diameter, alpha level), shared by all systems
+    _sprite_cache: Dict[Tuple[int, int, int, int, int], pygame.Surface] = {}
+
+    @classmethod
+    def get_sprite(cls, color: Tuple[int, int, int], diameter: int,
+                   alpha_level: int = ALPHA_LEVELS - 1) -> pygame.Surface:
+        """Get a circle sprite with its fade level drawn into the pixels"""
+        key = (color[0], color[1], color[2], diameter, alpha_level)
+        surf = cls._sprite_cache.get(key)
+        if surf is None:
+            radius = diameter // 2
+            alpha = alpha_level * 255 // (cls.ALPHA_LEVELS - 1)
+            surf = pygame.Surface((diameter, diameter), pygame.SRCALPHA).convert_alpha()
+            _draw_circle(surf, (key[0], key[1], key[2], alpha), (radius, radius), radius)
+            cls._sprite_cache[key] = surf
+        return surf
 
     def __init__(self):
         self.particles: List[Particle] = []
+        self.count = 0
+
+        if NUMPY_AVAILABLE:
+            n = self.CAPACITY
+            self._arrays: Dict[str, 'np.ndarray'] = {
+                "x": np.zeros(n, dtype=np.float32),
+                "y": np.zeros(n, dtype=np.float32),
+                "vx": np.zeros(n, dtype=np.float32),
+                "vy": np.zeros(n, dtype=np.float32),
+                "size": np.zeros(n, dtype=np.float32),
+                "gravity": np.zeros(n, dtype=np.float32),
+                "lifetime": np.zeros(n, dtype=np.int16),
+                "max_lifetime": np.zeros(n, dtype=np.int16),
+                "color": np.zeros((n, 3), dtype=np.uint8),
+            }
+
+    def _append(self, xs: Sequence[float], ys: Sequence[float], vxs: Sequence[float],
+                vys: Sequence[float], colors: Sequence[Tuple[int, int, int]],
+                sizes: Sequence[float], lifetimes: Sequence[int]):
+        """Add a batch of particles"""
+        if not NUMPY_AVAILABLE:
+            for particle in zip(xs, ys, vxs, vys, colors, sizes, lifetimes):
+                self.particles.append(Particle(*particle))
+            return
+
+        # Drop whatever doesn't fit rather than growing mid-fight
+        start = self.count
+        end = min(start + len(xs), self.CAPACITY)
+        k = end - start
+        if k <= 0:
+            return
+
+        a = self._arrays
+        a["x"][start:end] = xs[:k]
+        a["y"][start:end] = ys[:k]
+        a["vx"][start:end] = vxs[:k]
+        a["vy"][start:end] = vys[:k]
+        a["size"][start:end] = sizes[:k]
+        a["gravity"][start:end] = 0.3
+        a["lifetime"][start:end] = lifetimes[:k]
+        a["max_lifetime"][start:end] = lifetimes[:k]
+        a["color"][start:end] = colors[:k]
+        self.count = end
 
     def emit_hit_sparks(self, x: float, y: float, intensity: int = 10):
         """Emit hit spark particles"""
-        for _ in range(intensity):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(3, 8)
-            self.particles.append(Particle(
-                x, y,
-                math.cos(angle) * speed,
-                math.sin(angle) * speed,
-                random.choice([ORANGE, YELLOW, WHITE]),
-                random.uniform(3, 6),
-                random.randint(15, 30)
-            ))
+        if NUMPY_AVAILABLE and intensity >= self.VECTOR_EMIT_MIN:
+            angles = _RNG.uniform(0, math.pi * 2, intensity)
+            speeds = _RNG.uniform(3, 8, intensity)
+            self._append(
+                np.full(intensity, x), np.full(intensity, y),
+                np.cos(angles) * speeds,
+                np.sin(angles) * speeds,
+                _HIT_COLORS_ARRAY[_RNG.integers(0, len(_HIT_COLORS), intensity)],
+                _RNG.uniform(3, 6, intensity),
+                _RNG.integers(15, 31, intensity)
+            )
+            return
+
+        # Directions from the sine tables instead of a cos/sin call per particle
+        dirs = [int(random.random() * 256) for _ in range(intensity)]
+        speeds = [random.uniform(3, 8) for _ in range(intensity)]
+        self._append(
+            [x] * intensity, [y] * intensity,
+            [_COS_LUT[d] * s for d, s in zip(dirs, speeds)],
+            [_SIN_LUT[d] * s for d, s in zip(dirs, speeds)],
+            [random.choice(_HIT_COLORS) for _ in range(intensity)],
+            [random.uniform(3, 6) for _ in range(intensity)],
+            [random.randint(15, 30) for _ in range(intensity)]
+        )
 
     def emit_blood(self, x: float, y: float, direction: int, intensity: int = 5):
         """Emit blood particles"""
-        for _ in range(intensity):
-            self.particles.append(Particle(
-                x, y,
-                direction * random.uniform(2, 5),
-                random.uniform(-3, 0),
-                RED,
-                random.uniform(2, 4),
-                random.randint(20, 40)
-            ))
+        if NUMPY_AVAILABLE and intensity >= self.VECTOR_EMIT_MIN:
+            self._append(
+                np.full(intensity, x), np.full(intensity, y),
+                direction * _RNG.uniform(2, 5, intensity),
+                _RNG.uniform(-3, 0, intensity),
+                np.full((intensity, 3), RED),
+                _RNG.uniform(2, 4, intensity),
+                _RNG.integers(20, 41, intensity)
+            )
+            return
+
+        self._append(
+            [x] * intensity, [y] * intensity,
+            [direction * random.uniform(2, 5) for _ in range(intensity)],
+            [random.uniform(-3, 0) for _ in range(intensity)],
+            [RED] * intensity,
+            [random.uniform(2, 4) for _ in range(intensity)],
+            [random.randint(20, 40) for _ in range(intensity)]
+        )
 
     def emit_sweat(self, x: float, y: float):
         """Emit sweat particles"""
-        for _ in range(3):
-            self.particles.append(Particle(
-                x + random.uniform(-10, 10),
-                y + random.uniform(-20, 0),
-                random.uniform(-1, 1),
-                random.uniform(-2, 0),
-                (200, 200, 255),
-                random.uniform(1, 3),
-                random.randint(20, 35)
-            ))
+        # Only three particles, so always the scalar path
+        self._append(
+            [x + random.uniform(-10, 10) for _ in range(3)],
+            [y + random.uniform(-20, 0) for _ in range(3)],
+            [random.uniform(-1, 1) for _ in range(3)],
+            [random.uniform(-2, 0) for _ in range(3)],
+            [(200, 200, 255)] * 3,
+            [random.uniform(1, 3) for _ in range(3)],
+            [random.randint(20, 35) for _ in range(3)]
+        )
 
     def update(self):
-        for particle in self.particles[:]:
-            particle.update()
-            if not particle.is_alive():
-                self.particles.remove(particle)
+        if not NUMPY_AVAILABLE:
+            # Draw order doesn't matter, so dead particles are swapped with the last one
+            particles = self.particles
+            for i in range(len(particles) - 1, -1, -1):
+                particle = particles[i]
+                particle.update()
+                if not particle.is_alive():
+                    particles[i] = particles[-1]
+                    particles.pop()
+            return
 
-    def draw(self, screen: pygame.Surface):
-        for particle in self.particles:
-            particle.draw(screen)
+        n = self.count
+        if n == 0:
+            return
+
+        a = self._arrays
+        if NUMBA_AVAILABLE:
+            self.count = _update_particles(
+                a["x"], a["y"], a["vx"], a["vy"], a["size"], a["gravity"],
+                a["lifetime"], a["max_lifetime"], a["color"], n
+            )
+            return
+
+        vy = a["vy"][:n]
+        lifetime = a["lifetime"][:n]
+        size = a["size"][:n]
+        a["x"][:n] += a["vx"][:n]
+        a["y"][:n] += vy
+        vy += a["gravity"][:n]
+        lifetime -= 1
+        size *= 0.95
+
+        # Cull dead particles, keeping the live ones packed at the front
+        alive = (lifetime > 0) & (size > 0.5)
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            for arr in a.values():
+                arr[:len(keep)] = arr[keep]
+            self.count = len(keep)
+
+    def draw(self, screen: pygame.Surface) -> Optional[pygame.Rect]:
+        """Draw every particle and return the area they cover, if any"""
+        if not NUMPY_AVAILABLE:
+            if not self.particles:
+                return None
+            rects = screen.blits([particle.blit_item() for particle in self.particles])
+            return rects[0].unionall(rects[1:])
+
+        n = self.count
+        if n == 0:
+            return None
+
+        a = self._arrays
+        alpha = (255 * a["lifetime"][:n] / a["max_lifetime"][:n]).astype(np.uint8)
+        levels = alpha.astype(np.intp) * self.ALPHA_LEVELS >> 8
+        get_sprite = self.get_sprite
+        _blit_batch(screen, [
+            (get_sprite(color, int(size * 2), level), (int(x - size), int(y - size)))
+            for x, y, size, color, level in zip(a["x"][:n].tolist(), a["y"][:n].tolist(),
+                                                a["size"][:n].tolist(), a["color"][:n].tolist(),
+                                                levels.tolist())
+        ])
+
+        # Bounding box of all sprites, padded for int truncation
+        x, y, size = a["x"][:n], a["y"][:n], a["size"][:n]
+        left = int(np.floor((x - size).min())) - 1
+        top = int(np.floor((y - size).min())) - 1
+        right = int(np.ceil((x + size).max())) + 2
+        bottom = int(np.ceil((y + size).max())) + 2
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+
+@lru_cache(maxsize=128)
+def _popup_text(font: pygame.font.Font, damage: int, is_crit: bool) -> pygame.Surface:
+    """Render a damage number once; it never changes during a popup's lifetime"""
+    text = f"-{damage}"
+    if is_crit:
+        text += "!"
+    return font.render(text, True, GOLD if is_crit else WHITE)
+
+
+# A popup lives 60 frames and shrinks by 5% per frame over its last 20
+_POPUP_LIFETIME = 60
+_POPUP_SHRINK_STEPS = 20
+
+
+def _popup_rise(lifetime: int, vy: float) -> Tuple[float, ...]:
+    """Height gained after each frame by a popup that rises at vy, slowing 5% per frame"""
+    rise = [0.0]
+    for _ in range(lifetime):
+        rise.append(rise[-1] + vy)
+        vy *= 0.95
+    return tuple(rise)
+
+
+# Every popup follows the same path, so its height is looked up by age
+_POPUP_RISE = _popup_rise(_POPUP_LIFETIME, -3.0)
+
+
+@lru_cache(maxsize=128)
+def _popup_levels(font: pygame.font.Font, damage: int,
+                  is_crit: bool) -> Tuple[Optional[pygame.Surface], ...]:
+    """Every size a popup passes through, indexed by shrink step (None when empty)"""
+    text_surf = _popup_text(font, damage, is_crit)
+    levels = []
+    scale = 1.5 if is_crit else 1.0
+    for _ in range(_POPUP_SHRINK_STEPS + 1):
+        size = (int(text_surf.get_width() * scale), int(text_surf.get_height() * scale))
+        levels.append(pygame.transform.scale(text_surf, size) if size[0] > 0 and size[1] > 0 else None)
+        scale *= 0.95
+    return tuple(levels)
 
 
 class DamagePopup:
@@ -1163,41 +2072,37 @@ class DamagePopup:
 
     def __init__(self, x: float, y: float, damage: int, is_crit: bool = False):
         self.x = x
-        self.y = y
+        self.start_y = y
         self.damage = damage
         self.is_crit = is_crit
-        self.lifetime = 60
-        self.max_lifetime = 60
-        self.vy = -3
-        self.scale = 1.5 if is_crit else 1.0
+        self.lifetime = _POPUP_LIFETIME
+        self.max_lifetime = _POPUP_LIFETIME
+
+    @property
+    def y(self) -> float:
+        return self.start_y + _POPUP_RISE[self.max_lifetime - self.lifetime]
+
+    @property
+    def shrink_steps(self) -> int:
+        return max(0, _POPUP_SHRINK_STEPS - self.lifetime)
 
     def update(self):
-        self.y += self.vy
-        self.vy *= 0.95
         self.lifetime -= 1
-        if self.lifetime < 20:
-            self.scale *= 0.95
 
     def is_alive(self) -> bool:
         return self.lifetime > 0
 
-    def draw(self, screen: pygame.Surface, font: pygame.font.Font):
+    def draw(self, screen: pygame.Surface, font: pygame.font.Font) -> Optional[pygame.Rect]:
         alpha = int(255 * (self.lifetime / self.max_lifetime))
-        color = GOLD if self.is_crit else WHITE
-
-        text = f"-{self.damage}"
-        if self.is_crit:
-            text += "!"
 
-        # Create text surface with scaling
-        text_surf = font.render(text, True, color)
-        scaled_size = (int(text_surf.get_width() * self.scale),
-                       int(text_surf.get_height() * self.scale))
-        if scaled_size[0] > 0 and scaled_size[1] > 0:
-            scaled_surf = pygame.transform.scale(text_surf, scaled_size)
-            scaled_surf.set_alpha(alpha)
-            screen.blit(scaled_surf,
-                       (self.x - scaled_size[0] // 2, self.y - scaled_size[1] // 2))
+        # Pick the pre-scaled text for this point of the shrink
+        levels = _popup_levels(font, self.damage, self.is_crit)
+        scaled_surf = levels[self.shrink_steps]
+        if scaled_surf is None:
+            return None
+        scaled_surf.set_alpha(alpha)
+        return screen.blit(scaled_surf,
+                           (self.x - scaled_surf.get_width() // 2, self.y - scaled_surf.get_height() // 2))
 
 
 class ScreenEffects:
@@ -1209,6 +2114,10 @@ class ScreenEffects:
         self.flash_alpha = 0
         self.flash_color = WHITE
 
+        # Full-screen flash layer, created on first use and refilled only on color change
+        self._flash_surf: Optional[pygame.Surface] = None
+        self._flash_surf_color: Optional[Tuple[int, int, int]] = None
+
     def trigger_shake(self, intensity: int, duration: int):
         self.shake_intensity = intensity
         self.shake_duration = duration
@@ -1235,53 +2144,87 @@ class ScreenEffects:
 
     def draw_flash(self, screen: pygame.Surface):
         if self.flash_alpha > 0:
-            flash_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            flash_surf.fill((*self.flash_color, self.flash_alpha))
-            screen.blit(flash_surf, (0, 0))
+            if self._flash_surf is None:
+                self._flash_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            if self._flash_surf_color != self.flash_color:
+                self._flash_surf.fill(self.flash_color)
+                self._flash_surf_color = self.flash_color
+            self._flash_surf.set_alpha(self.flash_alpha)
+            screen.blit(self._flash_surf, (0, 0))
+
+
+def _pose(state: AnimationState, frame: int, facing: int) -> Tuple[int, int, bool]:
+    """Body offset, arm angle and lit glove for one animation frame"""
+    body_offset_x = 0
+    arm_angle = 0
+
+    if state == AnimationState.JAB:
+        arm_angle = -30 * facing
+        body_offset_x = 10 * facing * min(frame, 3)
+    elif state == AnimationState.CROSS:
+        arm_angle = -45 * facing
+        body_offset_x = 15 * facing * min(frame, 4)
+    elif state == AnimationState.HOOK:
+        arm_angle = 60 * facing if frame < 3 else -60 * facing
+        body_offset_x = 20 * facing * min(frame, 4)
+    elif state == AnimationState.UPPERCUT:
+        arm_angle = -90
+        body_offset_x = 10 * facing
+    elif state == AnimationState.BLOCK:
+        arm_angle = 45
+    elif state == AnimationState.DODGE:
+        body_offset_x = -30 * facing
+    elif state in HIT_ANIMATIONS:
+        body_offset_x = -10 * facing
+
+    glove_lit = frame > 2 and state in ATTACK_ANIMATIONS
+    return body_offset_x, arm_angle, glove_lit
+
+
+# Every pose stops changing after frame 4, so later frames reuse the last entry
+_POSE_FRAMES = 6
+_POSE_TABLE: Dict[Tuple[AnimationState, int], Tuple[Tuple[int, int, bool], ...]] = {
+    (state, facing): tuple(_pose(state, frame, facing) for frame in range(_POSE_FRAMES))
+    for state in AnimationState for facing in (1, -1)
+}
 
 
 class SpriteRenderer:
     """Renders fighter sprites procedurally"""
 
-    @staticmethod
-    def draw_fighter(screen: pygame.Surface, fighter: Fighter, offset: Tuple[int, int] = (0, 0)):
-        """Draw a fighter sprite"""
-        x = fighter.x + offset[0]
-        y = fighter.y + offset[1]
-        facing = fighter.facing
-        color = fighter.personality.color
-        secondary = fighter.personality.secondary_color
-
-        # Flash when hurt
-        if fighter.hurt_flash > 0 and fighter.hurt_flash % 4 < 2:
-            color = WHITE
-            secondary = LIGHT_GRAY
-
-        # Body dimensions based on animation
-        body_offset_x = 0
-        arm_angle = 0
-
-        if fighter.animation_state == AnimationState.JAB:
-            arm_angle = -30 * facing
-            body_offset_x = 10 * facing * min(fighter.animation_frame, 3)
-        elif fighter.animation_state == AnimationState.CROSS:
-            arm_angle = -45 * facing
-            body_offset_x = 15 * facing * min(fighter.animation_frame, 4)
-        elif fighter.animation_state == AnimationState.HOOK:
-            arm_angle = 60 * facing if fighter.animation_frame < 3 else -60 * facing
-            body_offset_x = 20 * facing * min(fighter.animation_frame, 4)
-        elif fighter.animation_state == AnimationState.UPPERCUT:
-            arm_angle = -90
-            body_offset_x = 10 * facing
-        elif fighter.animation_state == AnimationState.BLOCK:
-            arm_angle = 45
-        elif fighter.animation_state == AnimationState.DODGE:
-            body_offset_x = -30 * facing
-        elif fighter.animation_state in [AnimationState.HIT_LIGHT, AnimationState.HIT_HEAVY]:
-            body_offset_x = -10 * facing
+    # Pre-rendered fighter bodies keyed by colors and pose, least recently used first
+    SPRITE_CACHE_SIZE = 128
+    SPRITE_SIZE = (150, 140)
+    SPRITE_ANCHOR = (40, 74)  # Body position in a right-facing sprite
+    _sprite_cache: 'OrderedDict[Tuple, pygame.Surface]' = OrderedDict()
 
-        draw_x = x + body_offset_x
+    @classmethod
+    def _body_sprite(cls, color: Tuple[int, int, int], secondary: Tuple[int, int, int],
+                     glove_color: Tuple[int, int, int], facing: int,
+                     body_offset_x: float, arm_angle: float) -> pygame.Surface:
+        """Get the fighter body for this pose, drawing it on first use"""
+        key = (color, secondary, glove_color, facing, body_offset_x, arm_angle)
+        sprite = cls._sprite_cache.get(key)
+        if sprite is not None:
+            cls._sprite_cache.move_to_end(key)
+            return sprite
+
+        sprite = pygame.Surface(cls.SPRITE_SIZE, pygame.SRCALPHA).convert_alpha()
+        anchor_x = cls.SPRITE_ANCHOR[0] if facing > 0 else cls.SPRITE_SIZE[0] - cls.SPRITE_ANCHOR[0]
+        cls._draw_body(sprite, anchor_x, cls.SPRITE_ANCHOR[1], color, secondary,
+                       glove_color, facing, body_offset_x, arm_angle)
+
+        cls._sprite_cache[key] = sprite
+        if len(cls._sprite_cache) > cls.SPRITE_CACHE_SIZE:
+            cls._sprite_cache.popitem(last=False)
+        return sprite
 
+    @staticmethod
+    def _draw_body(screen: pygame.Surface, draw_x: float, y: float,
+                   color: Tuple[int, int, int], secondary: Tuple[int, int, int],
+                   glove_color: Tuple[int, int, int], facing: int,
+                   body_offset_x: float, arm_angle: float):
+        """Draw legs, body, arms and head with the body centred at (draw_x, y)"""
         # Legs
         leg_spread = 15
         pygame.draw.line(screen, secondary,
@@ -1308,7 +2251,7 @@ class SpriteRenderer:
         pygame.draw.line(screen, secondary,
                         (back_arm_x, arm_base_y),
                         (back_arm_x - 20 * facing, arm_base_y + 15), 6)
-        pygame.draw.circle(screen, BROWN,
+        _draw_circle(screen, BROWN,
                           (int(back_arm_x - 20 * facing), int(arm_base_y + 15)), 8)
 
         # Front arm (punching arm)
@@ -1319,26 +2262,52 @@ class SpriteRenderer:
                         (arm_end_x, arm_end_y), 7)
 
         # Glove
-        glove_color = color
-        if fighter.animation_state in [AnimationState.JAB, AnimationState.CROSS,
-                                        AnimationState.HOOK, AnimationState.UPPERCUT]:
-            glove_color = YELLOW if fighter.animation_frame > 2 else color
-        pygame.draw.circle(screen, glove_color, (int(arm_end_x), int(arm_end_y)), 12)
-        pygame.draw.circle(screen, WHITE, (int(arm_end_x), int(arm_end_y)), 12, 2)
+        _draw_circle(screen, glove_color, (int(arm_end_x), int(arm_end_y)), 12)
+        _draw_circle(screen, WHITE, (int(arm_end_x), int(arm_end_y)), 12, 2)
 
         # Head
         head_x = draw_x + (5 * facing)
         head_y = y - 50
-        pygame.draw.circle(screen, (255, 220, 180), (int(head_x), int(head_y)), 22)
+        _draw_circle(screen, (255, 220, 180), (int(head_x), int(head_y)), 22)
 
         # Face direction indicator
         eye_x = head_x + (8 * facing)
-        pygame.draw.circle(screen, BLACK, (int(eye_x), int(head_y - 3)), 3)
+        _draw_circle(screen, BLACK, (int(eye_x), int(head_y - 3)), 3)
+
+    @classmethod
+    def draw_fighter(cls, screen: pygame.Surface, fighter: Fighter,
+                     offset: Tuple[int, int] = (0, 0), tick: int = 0) -> pygame.Rect:
+        """Draw a fighter sprite and return the area it covers"""
+        x = fighter.x + offset[0]
+        y = fighter.y + offset[1]
+        facing = fighter.facing
+        color = fighter.personality.color
+        secondary = fighter.personality.secondary_color
+
+        # Flash when hurt
+        if fighter.hurt_flash > 0 and fighter.hurt_flash % 4 < 2:
+            color = WHITE
+            secondary = LIGHT_GRAY
+
+        # Body dimensions based on animation
+        body_offset_x, arm_angle, glove_lit = _POSE_TABLE[(fighter.animation_state, facing)][
+            min(fighter.animation_frame, _POSE_FRAMES - 1)
+        ]
+        draw_x = x + body_offset_x
+        glove_color = YELLOW if glove_lit else color
+
+        # Body, from the pose cache
+        sprite = cls._body_sprite(color, secondary, glove_color, facing, body_offset_x, arm_angle)
+        anchor_x = cls.SPRITE_ANCHOR[0] if facing > 0 else cls.SPRITE_SIZE[0] - cls.SPRITE_ANCHOR[0]
+        rect = screen.blit(sprite, (int(draw_x) - anchor_x, int(y) - cls.SPRITE_ANCHOR[1]))
+
+        head_x = draw_x + (5 * facing)
+        head_y = y - 50
 
         # Health indicator above head
         health_pct = fighter.health / fighter.stats.max_health
         indicator_color = GREEN if health_pct > 0.5 else YELLOW if health_pct > 0.25 else RED
-        pygame.draw.circle(screen, indicator_color, (int(head_x), int(head_y - 35)), 5)
+        _draw_circle(screen, indicator_color, (int(head_x), int(head_y - 35)), 5)
 
         # Blocking indicator
         if fighter.is_blocking:
@@ -1347,12 +2316,15 @@ class SpriteRenderer:
                            0 if facing > 0 else math.pi,
                            math.pi if facing > 0 else math.pi * 2, 4)
 
-        # Stun indicator
+        # Stun indicator, orbiting at about 5 and 3 rad/s at 60 FPS
         if fighter.stun_timer > 0:
             for i in range(3):
-                star_x = head_x + math.cos(time.time() * 5 + i * 2) * 25
-                star_y = head_y - 40 + math.sin(time.time() * 3 + i) * 5
-                pygame.draw.circle(screen, YELLOW, (int(star_x), int(star_y)), 4)
+                star_x = head_x + _COS_LUT[(tick * 3 + i * 81) & 255] * 25
+                star_y = head_y - 40 + _SIN_LUT[(tick * 2 + i * 41) & 255] * 5
+                _draw_circle(screen, YELLOW, (int(star_x), int(star_y)), 4)
+
+        # Health indicator and stun stars sit above the body sprite
+        return rect.union(pygame.Rect(int(head_x) - 32, int(head_y) - 52, 64, 24))
 
 
 # ============================================================================
@@ -1371,15 +2343,16 @@ class HealthBar:
         self.displayed_value = 100
         self.target_value = 100
 
+        # Last rendered bar, redrawn only when it changes by a pixel or color
+        self._surface: Optional[pygame.Surface] = None
+        self._drawn: Optional[Tuple[int, Tuple[int, int, int]]] = None
+
     def update(self, current: float, maximum: float):
         self.target_value = (current / maximum) * 100
         # Smooth interpolation
         self.displayed_value += (self.target_value - self.displayed_value) * 0.1
 
     def draw(self, screen: pygame.Surface):
-        # Background
-        pygame.draw.rect(screen, DARK_GRAY, (self.x, self.y, self.width, self.height))
-
         # Health fill
         fill_width = int((self.displayed_value / 100) * (self.width - 4))
 
@@ -1391,17 +2364,28 @@ class HealthBar:
         else:
             color = RED
 
-        if self.align == "left":
-            fill_x = self.x + 2
-        else:
-            fill_x = self.x + self.width - 2 - fill_width
+        if self._drawn != (fill_width, color):
+            if self._surface is None:
+                self._surface = pygame.Surface((self.width, self.height))
+            surf = self._surface
 
-        if fill_width > 0:
-            pygame.draw.rect(screen, color,
-                           (fill_x, self.y + 2, fill_width, self.height - 4))
+            # Background
+            pygame.draw.rect(surf, DARK_GRAY, (0, 0, self.width, self.height))
 
-        # Border
-        pygame.draw.rect(screen, WHITE, (self.x, self.y, self.width, self.height), 2)
+            if self.align == "left":
+                fill_x = 2
+            else:
+                fill_x = self.width - 2 - fill_width
+
+            if fill_width > 0:
+                pygame.draw.rect(surf, color,
+                               (fill_x, 2, fill_width, self.height - 4))
+
+            # Border
+            pygame.draw.rect(surf, WHITE, (0, 0, self.width, self.height), 2)
+            self._drawn = (fill_width, color)
+
+        screen.blit(self._surface, (self.x, self.y))
 
 
 class StaminaBar:
@@ -1415,25 +2399,37 @@ class StaminaBar:
         self.align = align
         self.displayed_value = 100
 
+        # Last rendered bar, redrawn only when the fill changes by a pixel
+        self._surface: Optional[pygame.Surface] = None
+        self._drawn_width: Optional[int] = None
+
     def update(self, current: float, maximum: float):
         target = (current / maximum) * 100
         self.displayed_value += (target - self.displayed_value) * 0.15
 
     def draw(self, screen: pygame.Surface):
-        pygame.draw.rect(screen, DARK_GRAY, (self.x, self.y, self.width, self.height))
-
         fill_width = int((self.displayed_value / 100) * (self.width - 4))
 
-        if self.align == "left":
-            fill_x = self.x + 2
-        else:
-            fill_x = self.x + self.width - 2 - fill_width
+        if self._drawn_width != fill_width:
+            if self._surface is None:
+                self._surface = pygame.Surface((self.width, self.height))
+            surf = self._surface
 
-        if fill_width > 0:
-            pygame.draw.rect(screen, GOLD,
-                           (fill_x, self.y + 2, fill_width, self.height - 4))
+            pygame.draw.rect(surf, DARK_GRAY, (0, 0, self.width, self.height))
 
-        pygame.draw.rect(screen, WHITE, (self.x, self.y, self.width, self.height), 2)
+            if self.align == "left":
+                fill_x = 2
+            else:
+                fill_x = self.width - 2 - fill_width
+
+            if fill_width > 0:
+                pygame.draw.rect(surf, GOLD,
+                               (fill_x, 2, fill_width, self.height - 4))
+
+            pygame.draw.rect(surf, WHITE, (0, 0, self.width, self.height), 2)
+            self._drawn_width = fill_width
+
+        screen.blit(self._surface, (self.x, self.y))
 
 
 class TextBox:
@@ -1450,6 +2446,13 @@ class TextBox:
         self.typing_index = 0
         self.typing_speed = 2
         self.typing_timer = 0
+        # The message being typed; later messages may already sit below it
+        self._typing_msg: Optional[Dict[str, Any]] = None
+
+        # Static parts of the box, rendered on first draw
+        self._bg_surf: Optional[pygame.Surface] = None
+        self._title_surf: Optional[pygame.Surface] = None
+        self._title_font: Optional[pygame.font.Font] = None
 
     def add_message(self, text: str, color: Tuple[int, int, int] = WHITE,
                     typing: bool = False):
@@ -1457,9 +2460,10 @@ class TextBox:
         if typing:
             self.typing_text = text
             self.typing_index = 0
-            self.messages.append({"text": "", "color": color, "typing": True})
+            self._typing_msg = {"text": "", "color": color, "typing": True, "lines": None}
+            self.messages.append(self._typing_msg)
         else:
-            self.messages.append({"text": text, "color": color, "typing": False})
+            self.messages.append({"text": text, "color": color, "typing": False, "lines": None})
 
         while len(self.messages) > self.max_messages:
             self.messages.pop(0)
@@ -1471,9 +2475,24 @@ class TextBox:
             if self.typing_timer >= self.typing_speed:
                 self.typing_timer = 0
                 self.typing_index += 1
-                # Update the last message
-                if self.messages and self.messages[-1].get("typing"):
-                    self.messages[-1]["text"] = self.typing_text[:self.typing_index]
+                if self._typing_msg is not None:
+                    self._typing_msg["text"] = self.typing_text[:self.typing_index]
+                    self._typing_msg["lines"] = None
+
+    def append_partial(self, text: str):
+        """Extend the message being typed, e.g. as streamed tokens arrive"""
+        self.typing_text += text
+
+    def finish_partial(self, text: str):
+        """Settle the message being typed on its final text"""
+        typed = self.typing_text[:self.typing_index]
+        self.typing_text = text
+        if not text.startswith(typed):
+            # The stream was abandoned; type the replacement from the start
+            self.typing_index = 0
+            if self._typing_msg is not None:
+                self._typing_msg["text"] = ""
+                self._typing_msg["lines"] = None
 
     def is_typing_complete(self) -> bool:
         return self.typing_index >= len(self.typing_text)
@@ -1482,52 +2501,68 @@ class TextBox:
         """Skip to end of typing animation"""
         if self.typing_text and self.messages:
             self.typing_index = len(self.typing_text)
-            if self.messages[-1].get("typing"):
-                self.messages[-1]["text"] = self.typing_text
-                self.messages[-1]["typing"] = False
+            if self._typing_msg is not None:
+                self._typing_msg["text"] = self.typing_text
+                self._typing_msg["typing"] = False
+                self._typing_msg["lines"] = None
 
     def clear(self):
         self.messages.clear()
         self.typing_text = ""
         self.typing_index = 0
+        self._typing_msg = None
+
+    def _wrap(self, text: str, font: pygame.font.Font) -> List[str]:
+        """Word wrap text to the box width"""
+        lines = []
+        current_line = ""
+
+        for word in text.split():
+            test_line = current_line + " " + word if current_line else word
+            if font.size(test_line)[0] < self.width - 20:
+                current_line = test_line
+            else:
+                if current_line:
+                    lines.append(current_line)
+                current_line = word
+        if current_line:
+            lines.append(current_line)
+
+        return lines
 
     def draw(self, screen: pygame.Surface, font: pygame.font.Font):
         # Background
-        bg_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        bg_surf.fill((20, 20, 30, 220))
-        screen.blit(bg_surf, (self.x, self.y))
+        if self._bg_surf is None:
+            self._bg_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            self._bg_surf.fill((20, 20, 30, 220))
+        screen.blit(self._bg_surf, (self.x, self.y))
 
         # Border
         pygame.draw.rect(screen, CYAN, (self.x, self.y, self.width, self.height), 2)
 
         # Title
-        title = font.render("AI THOUGHTS & ACTIONS", True, CYAN)
-        screen.blit(title, (self.x + 10, self.y + 5))
+        if self._title_font is not font:
+            self._title_surf = font.render("AI THOUGHTS & ACTIONS", True, CYAN)
+            self._title_font = font
+        screen.blit(self._title_surf, (self.x + 10, self.y + 5))
 
         # Messages
         y_offset = 30
         line_height = 22
 
         for msg in self.messages:
-            # Word wrap
-            words = msg["text"].split()
-            lines = []
-            current_line = ""
-
-            for word in words:
-                test_line = current_line + " " + word if current_line else word
-                if font.size(test_line)[0] < self.width - 20:
-                    current_line = test_line
-                else:
-                    if current_line:
-                        lines.append(current_line)
-                    current_line = word
-            if current_line:
-                lines.append(current_line)
-
-            for line in lines:
+            # Wrap and render once; "lines" is reset whenever the text changes
+            if msg["lines"] is None or msg.get("font") is not font:
+                lines = self._wrap(msg["text"], font)
+                # While typing only the last line grows, so keep the lines already rendered
+                rendered = dict(zip(msg["rendered"], msg["surfaces"])) if msg.get("font") is font else {}
+                msg["surfaces"] = [rendered.get(line) or font.render(line, True, msg["color"])
+                                   for line in lines]
+                msg["lines"] = msg["rendered"] = lines
+                msg["font"] = font
+
+            for text_surf in msg["surfaces"]:
                 if y_offset + line_height < self.height - 5:
-                    text_surf = font.render(line, True, msg["color"])
                     screen.blit(text_surf, (self.x + 10, self.y + y_offset))
                     y_offset += line_height
 
@@ -1544,6 +2579,10 @@ class Button:
         self.color = color
         self.hover_color = tuple(min(c + 40, 255) for c in color)
         self.is_hovered = False
+        # Label and where it goes, rendered on the first draw with a given font
+        self._text_font: Optional[pygame.font.Font] = None
+        self._text_surf: Optional[pygame.Surface] = None
+        self._text_rect: Optional[pygame.Rect] = None
 
     def update(self, mouse_pos: Tuple[int, int]):
         self.is_hovered = self.rect.collidepoint(mouse_pos)
@@ -1556,9 +2595,11 @@ class Button:
         pygame.draw.rect(screen, color, self.rect)
         pygame.draw.rect(screen, WHITE, self.rect, 2)
 
-        text_surf = font.render(self.text, True, WHITE)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        screen.blit(text_surf, text_rect)
+        if font is not self._text_font:
+            self._text_surf = font.render(self.text, True, WHITE)
+            self._text_rect = self._text_surf.get_rect(center=self.rect.center)
+            self._text_font = font
+        screen.blit(self._text_surf, self._text_rect)
 
 
 class RingRenderer:
@@ -1586,7 +2627,7 @@ class RingRenderer:
         ]
         for px, py in post_positions:
             pygame.draw.rect(screen, RING_POST, (px - 10, py - 40, 20, 80))
-            pygame.draw.circle(screen, GRAY, (px, py - 40), 12)
+            _draw_circle(screen, GRAY, (px, py - 40), 12)
 
         # Ropes
         rope_colors = [RING_ROPE_RED, RING_ROPE_WHITE, RING_ROPE_BLUE]
@@ -1605,15 +2646,33 @@ class RingRenderer:
 # SECTION 8: GAME ENGINE
 # ============================================================================
 
+@lru_cache(maxsize=16)
+def _overlay_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int],
+                  center: Tuple[int, int]) -> Tuple[pygame.Surface, pygame.Rect]:
+    """Render overlay text and place it once; it stays the same for as long as the overlay is up"""
+    surf = font.render(text, True, color)
+    return surf, surf.get_rect(center=center)
+
+
 class Game:
     """Main game engine"""
 
-    def __init__(self):
+    # The only events the game reacts to; mouse motion and the rest are never queued
+    HANDLED_EVENTS = (pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN,
+                      pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
         pygame.init()
         pygame.font.init()
 
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("SYNTAX BRAWLERS - LLM Arena Fighting")
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.HANDLED_EVENTS)
+
+        # Event loop for LLM requests, pumped once per frame by run()
+        self.loop = loop or asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
 
         self.clock = pygame.time.Clock()
         self.running = True
@@ -1623,9 +2682,69 @@ class Game:
         self.font_medium = pygame.font.Font(None, 32)
         self.font_small = pygame.font.Font(None, 24)
 
+        # Text that never changes, rendered once
+        self._title_surf = self.font_large.render("SYNTAX BRAWLERS", True, GOLD)
+        self._subtitle_surf = self.font_medium.render("LLM Arena Fighting", True, CYAN)
+        self._select_title_surf = self.font_large.render("SELECT FIGHTERS", True, GOLD)
+        self._select_instr_surfs = {
+            1: self.font_medium.render("Select Fighter 1 (Left Corner)", True, CYAN),
+            2: self.font_medium.render("Select Fighter 2 (Right Corner)", True, ORANGE),
+        }
+        self._char_desc_surfs = {
+            ptype: self.font_small.render(p.fighting_style[:40] + "...", True, LIGHT_GRAY)
+            for ptype, p in PERSONALITIES.items()
+        }
+        self._header_title_surf = self.font_medium.render("SYNTAX BRAWLERS", True, CYAN)
+        self._controls_surf = self.font_small.render(
+            "[ESC] Pause  |  [R] Restart  |  [SPACE] Skip Text", True, GRAY
+        )
+        self._title_rect = self._title_surf.get_rect(center=(SCREEN_WIDTH // 2, 150))
+        self._subtitle_rect = self._subtitle_surf.get_rect(center=(SCREEN_WIDTH // 2, 200))
+        self._select_title_rect = self._select_title_surf.get_rect(center=(SCREEN_WIDTH // 2, 50))
+        self._select_instr_rects = {
+            stage: surf.get_rect(center=(SCREEN_WIDTH // 2, 100))
+            for stage, surf in self._select_instr_surfs.items()
+        }
+        self._header_title_rect = self._header_title_surf.get_rect(center=(SCREEN_WIDTH // 2, 65))
+        self._controls_rect = self._controls_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 15))
+
+        # Dimming layers and fixed text for the pause, round-end and match-end overlays
+        self._overlays: Dict[int, pygame.Surface] = {}
+        for alpha in (150, 180, 200):
+            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            overlay.fill(BLACK)
+            overlay.set_alpha(alpha)
+            self._overlays[alpha] = overlay
+        self._pause_surf = self.font_large.render("PAUSED", True, WHITE)
+        self._resume_surf = self.font_medium.render("Press ESC to resume", True, GRAY)
+        self._winner_surf = self.font_large.render("WINNER!", True, GOLD)
+        self._restart_surf = self.font_medium.render("Press R to restart or ESC for menu", True, GRAY)
+        self._pause_rect = self._pause_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        self._resume_rect = self._resume_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
+        self._winner_rect = self._winner_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
+        self._restart_rect = self._restart_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 130))
+
+        # HUD text and the value it shows, re-rendered only when the value changes
+        self._round_shown = -1
+        self._round_surf: Optional[pygame.Surface] = None
+        self._time_shown = -1
+        self._timer_surf: Optional[pygame.Surface] = None
+        self._timer_rect: Optional[pygame.Rect] = None
+        self._score_shown: Optional[Tuple[int, int]] = None
+        self._score_surf: Optional[pygame.Surface] = None
+        self._score_rect: Optional[pygame.Rect] = None
+
+        # Screen areas drawn this frame and last frame, pushed to the window
+        # with display.update instead of flipping the whole screen
+        self._dirty: List[pygame.Rect] = []
+        self._last_dirty: List[pygame.Rect] = []
+        self._last_frame: Optional[Tuple] = None
+        self._last_scene: Optional[Tuple] = None
+
         # Game state
         self.state = GameState.MAIN_MENU
         self.previous_state = None
+        self.tick = 0  # Frames since start, drives looping animations
 
         # Fighters
         self.fighter1: Optional[Fighter] = None
@@ -1651,6 +2770,11 @@ class Game:
         self.stamina_bar2 = StaminaBar(980, 130, 250, 15, "right")
         self.text_box = TextBox(50, 520, 1180, 150)
 
+        # Areas redrawn every fight frame: header, fighter panels and bars, text box
+        self._hud_rect = pygame.Rect(0, 0, SCREEN_WIDTH, 170)
+        self._text_box_rect = pygame.Rect(self.text_box.x, self.text_box.y,
+                                          self.text_box.width, self.text_box.height)
+
         # Menu buttons
         self.menu_buttons = [
             Button(490, 300, 300, 50, "NEW FIGHT", BLUE),
@@ -1665,12 +2789,17 @@ class Game:
                 Button(100 + (i % 2) * 300, 200 + (i // 2) * 150, 250, 120,
                        PERSONALITIES[ptype].name, PERSONALITIES[ptype].color)
             )
+        self._char_btn_ptypes = tuple(zip(self.char_buttons, PersonalityType))
+
+        # Mouse position and screen the button hover states were last updated for
+        self._last_hover_key: Optional[Tuple] = None
 
         # Turn management
         self.turn_state = "waiting"  # waiting, thinking, acting, result
         self.turn_timer = 0
         self.current_response: Optional[LLMResponse] = None
         self.current_result: Optional[ActionResult] = None
+        self._pending_decision: Optional[asyncio.Future] = None
 
         # LLM providers
         self.llm_provider1: Optional[BaseLLMProvider] = None
@@ -1684,8 +2813,13 @@ class Game:
 
     def _setup_llm_providers(self):
         """Setup available LLM providers"""
+        # Every provider reuses one keep-alive pool instead of reconnecting per turn
+        http = BaseLLMProvider.get_client() if HTTPX_AVAILABLE else None
+        # Greedy sampling, so a state always gets the same reply and caching it is sound
+        sampling = dict(temperature=0.0, top_p=1.0, frequency_penalty=0.0, presence_penalty=0.0)
+
         # Try OpenRouter first (DeepSeek v3.2)
-        openrouter = OpenRouterProvider("deepseek/deepseek-v3.2")
+        openrouter = OpenRouterProvider("deepseek/deepseek-v3.2", client=http, **sampling)
         if openrouter.is_available():
             self.llm_provider1 = openrouter
             self.llm_provider2 = openrouter
@@ -1693,7 +2827,7 @@ class Game:
             return
 
         # Try Anthropic
-        anthropic = AnthropicProvider()
+        anthropic = AnthropicProvider(client=http, temperature=sampling["temperature"])
         if anthropic.is_available():
             self.llm_provider1 = anthropic
             self.llm_provider2 = anthropic
@@ -1701,7 +2835,7 @@ class Game:
             return
 
         # Try OpenAI
-        openai = OpenAIProvider()
+        openai = OpenAIProvider(client=http, **sampling)
         if openai.is_available():
             self.llm_provider1 = openai
             self.llm_provider2 = openai
@@ -1709,7 +2843,7 @@ class Game:
             return
 
         # Try Ollama
-        ollama = OllamaProvider()
+        ollama = OllamaProvider(client=http, temperature=sampling["temperature"], top_p=sampling["top_p"])
         if ollama.is_available():
             self.llm_provider1 = ollama
             self.llm_provider2 = ollama
@@ -1720,13 +2854,22 @@ class Game:
 
     def run(self):
         """Main game loop"""
+        accumulator = 0.0
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
+            # Fixed-step logic: slow frames run several steps, fast ones may run none
+            accumulator += self.clock.tick(FPS) / 1000.0
+            accumulator = min(accumulator, MAX_CATCHUP_STEPS * FIXED_DT)
 
             self._handle_events()
-            self._update(dt)
+            while accumulator >= FIXED_DT:
+                self._update(FIXED_DT)
+                accumulator -= FIXED_DT
             self._render()
 
+            # Let background LLM requests make progress between frames
+            self.loop.call_soon(self.loop.stop)
+            self.loop.run_forever()
+
         pygame.quit()
 
     def _handle_events(self):
@@ -1734,10 +2877,15 @@ class Game:
         mouse_pos = pygame.mouse.get_pos()
         mouse_click = False
 
-        for event in pygame.event.get():
+        for event in pygame.event.get(self.HANDLED_EVENTS):
             if event.type == pygame.QUIT:
                 self.running = False
 
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # The window contents were lost, so repaint all of it
+                self._last_frame = None
+                self._last_scene = None
+
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:
                     mouse_click = True
@@ -1759,6 +2907,12 @@ class Game:
                     if self.state in [GameState.FIGHTING, GameState.MATCH_END]:
                         self._start_new_match()
 
+        # Hover only changes when the mouse moves or another screen comes up
+        hover_key = (mouse_pos, self.state)
+        if hover_key == self._last_hover_key and not mouse_click:
+            return
+        self._last_hover_key = hover_key
+
         # Button updates
         if self.state == GameState.MAIN_MENU:
             for btn in self.menu_buttons:
@@ -1771,10 +2925,9 @@ class Game:
                         self.running = False
 
         elif self.state == GameState.CHARACTER_SELECT:
-            for i, btn in enumerate(self.char_buttons):
+            for btn, ptype in self._char_btn_ptypes:
                 btn.update(mouse_pos)
                 if btn.is_clicked(mouse_pos, mouse_click):
-                    ptype = list(PersonalityType)[i]
                     if self.selection_stage == 1:
                         self.selected_personality1 = ptype
                         self.selection_stage = 2
@@ -1784,15 +2937,16 @@ class Game:
 
     def _update(self, dt: float):
         """Update game state"""
+        self.tick += 1
+
         # Update visual systems
         self.particles.update()
         self.screen_effects.update()
         self.text_box.update()
 
-        for popup in self.damage_popups[:]:
+        for popup in self.damage_popups:
             popup.update()
-            if not popup.is_alive():
-                self.damage_popups.remove(popup)
+        self.damage_popups = [popup for popup in self.damage_popups if popup.is_alive()]
 
         if self.state == GameState.FIGHTING:
             self._update_fight(dt)
@@ -1842,14 +2996,22 @@ class Game:
             if attacker.can_act():
                 self.turn_state = "thinking"
                 self.turn_timer = 0
-                # Start AI decision
+                # Start AI decision; it runs in the background while frames keep going
                 if attacker.ai:
-                    asyncio.get_event_loop().run_until_complete(
-                        self._get_ai_decision(attacker, defender)
+                    self._pending_decision = asyncio.ensure_future(
+                        self._get_ai_decision(attacker, defender), loop=self.loop
                     )
 
         elif self.turn_state == "thinking":
             self.turn_timer += 1
+            pending = self._pending_decision
+            if pending is not None:
+                if not pending.done():
+                    return
+                self._pending_decision = None
+                if not pending.cancelled() and pending.exception():
+                    print(f"AI decision failed: {pending.exception()}")
+
             if self.turn_timer > 30 and self.text_box.is_typing_complete():
                 self.turn_state = "acting"
                 self.turn_timer = 0
@@ -1865,6 +3027,12 @@ class Game:
                     attacker, defender, action
                 )
 
+                # Start the defender's next decision while this turn animates,
+                # unless a stun or KO makes its next turn unpredictable
+                if defender.ai and defender.can_act() and not defender.is_knocked_out():
+                    defender.ai.prefetch(defender, attacker, self.round_number, self.loop,
+                                         self._stamina_at_next_turn(defender))
+
                 # Visual feedback
                 if self.current_result.success and self.current_result.damage_dealt > 0:
                     self.particles.emit_hit_sparks(defender.x, defender.y - 30,
@@ -1898,19 +3066,46 @@ class Game:
                 self.current_response = None
                 self.current_result = None
 
+    def _stamina_at_next_turn(self, fighter: Fighter) -> float:
+        """Stamina the fighter will have when the turn passes to it
+
+        Called on the first "acting" frame: 60 more acting frames, 31 result
+        frames and the "waiting" frame pass first, and stamina only
+        regenerates once a block or dodge has run out.
+        """
+        frames = 60 + 31 + 1
+        if fighter.is_blocking:
+            frames -= fighter.block_timer - 1
+        if fighter.is_dodging:
+            frames -= fighter.dodge_timer - 1
+        regen = fighter.stats.stamina_regen * FIXED_DT * max(0, frames)
+        return min(fighter.stats.max_stamina, fighter.stamina + regen)
+
     async def _get_ai_decision(self, attacker: Fighter, defender: Fighter):
         """Get decision from AI"""
         if attacker.ai:
+            name = attacker.personality.name
+            color = attacker.personality.color
+            streamed = False
+
+            def on_thinking(text: str):
+                # Type the thinking out as the LLM produces it
+                nonlocal streamed
+                if not streamed:
+                    self.text_box.add_message(f"{name} [thinking]: \"", LIGHT_GRAY, typing=True)
+                    streamed = True
+                self.text_box.append_partial(text)
+
             self.current_response = await attacker.ai.decide(
-                attacker, defender, self.round_number
+                attacker, defender, self.round_number, on_thinking=on_thinking
             )
 
             # Display thinking
-            name = attacker.personality.name
-            color = attacker.personality.color
-
             thinking_msg = f"{name} [thinking]: \"{self.current_response.thinking}\""
-            self.text_box.add_message(thinking_msg, LIGHT_GRAY, typing=True)
+            if streamed:
+                self.text_box.finish_partial(thinking_msg)
+            else:
+                self.text_box.add_message(thinking_msg, LIGHT_GRAY, typing=True)
 
             # Queue trash talk (will be added after thinking completes)
             trash_msg = f"{name}: \"{self.current_response.trash_talk}\""
@@ -1968,6 +3163,14 @@ class Game:
     def _start_new_match(self):
         """Start a new match"""
         if self.selected_personality1 and self.selected_personality2:
+            for old_fighter in (self.fighter1, self.fighter2):
+                if old_fighter and old_fighter.ai:
+                    old_fighter.ai.cancel_prefetch()
+            if self._pending_decision is not None:
+                self._pending_decision.cancel()
+                self._pending_decision = None
+            self.current_response = None
+
             p1 = PERSONALITIES[self.selected_personality1]
             p2 = PERSONALITIES[self.selected_personality2]
 
@@ -1989,37 +3192,59 @@ class Game:
 
             self.state = GameState.FIGHTING
 
+    def _scene_key(self) -> Optional[Tuple]:
+        """Everything a static screen depends on, or None while something animates"""
+        if self.screen_effects.flash_alpha > 0:
+            return None
+        if self.state == GameState.MAIN_MENU:
+            return (self.state, tuple(btn.is_hovered for btn in self.menu_buttons))
+        if self.state == GameState.CHARACTER_SELECT:
+            return (self.state, self.selection_stage, self.selected_personality1,
+                    tuple(btn.is_hovered for btn in self.char_buttons))
+        return None
+
     def _render(self):
         """Render the game"""
+        # Menus that look the same as last frame are already on screen
+        scene = self._scene_key()
+        if scene is not None and scene == self._last_scene:
+            return
+        self._last_scene = scene
+
         # Get screen shake offset
         offset = self.screen_effects.get_offset()
 
-        # Clear screen
-        self.screen.fill((30, 30, 40))
-
         if self.state == GameState.MAIN_MENU:
+            self.screen.fill((30, 30, 40))
             self._render_menu()
         elif self.state == GameState.CHARACTER_SELECT:
+            self.screen.fill((30, 30, 40))
             self._render_character_select()
         elif self.state in [GameState.FIGHTING, GameState.ROUND_END,
                             GameState.MATCH_END, GameState.PAUSED]:
             self._render_fight(offset)
+        else:
+            self.screen.fill((30, 30, 40))
 
         # Screen flash
         self.screen_effects.draw_flash(self.screen)
 
-        pygame.display.flip()
+        # Shakes, flashes and state changes touch the whole screen; otherwise
+        # only what moved this frame or last frame needs to reach the window
+        frame = (self.state, offset, self.screen_effects.flash_alpha > 0)
+        if scene is not None or frame != self._last_frame or offset != (0, 0) or frame[2]:
+            pygame.display.flip()
+        else:
+            dirty = self._dirty
+            pygame.display.update(dirty + [rect for rect in self._last_dirty if rect not in dirty])
+        self._last_frame = frame
+        self._last_dirty, self._dirty = self._dirty, []
 
     def _render_menu(self):
         """Render main menu"""
         # Title
-        title = self.font_large.render("SYNTAX BRAWLERS", True, GOLD)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 150))
-        self.screen.blit(title, title_rect)
-
-        subtitle = self.font_medium.render("LLM Arena Fighting", True, CYAN)
-        sub_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 200))
-        self.screen.blit(subtitle, sub_rect)
+        self.screen.blit(self._title_surf, self._title_rect)
+        self.screen.blit(self._subtitle_surf, self._subtitle_rect)
 
         # Buttons
         for btn in self.menu_buttons:
@@ -2037,32 +3262,18 @@ class Game:
 
     def _render_character_select(self):
         """Render character selection"""
-        title = self.font_large.render("SELECT FIGHTERS", True, GOLD)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 50))
-        self.screen.blit(title, title_rect)
+        self.screen.blit(self._select_title_surf, self._select_title_rect)
 
         # Selection instruction
-        if self.selection_stage == 1:
-            instr = "Select Fighter 1 (Left Corner)"
-            color = CYAN
-        else:
-            instr = "Select Fighter 2 (Right Corner)"
-            color = ORANGE
-
-        instr_text = self.font_medium.render(instr, True, color)
-        instr_rect = instr_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
-        self.screen.blit(instr_text, instr_rect)
+        stage = 1 if self.selection_stage == 1 else 2
+        self.screen.blit(self._select_instr_surfs[stage], self._select_instr_rects[stage])
 
         # Character buttons with descriptions
-        for i, btn in enumerate(self.char_buttons):
+        for btn, ptype in self._char_btn_ptypes:
             btn.draw(self.screen, self.font_medium)
 
-            # Show personality info
-            ptype = list(PersonalityType)[i]
-            p = PERSONALITIES[ptype]
-
             # Description under button
-            desc = self.font_small.render(p.fighting_style[:40] + "...", True, LIGHT_GRAY)
+            desc = self._char_desc_surfs[ptype]
             self.screen.blit(desc, (btn.rect.x, btn.rect.bottom + 5))
 
         # Show selected fighter 1
@@ -2079,18 +3290,28 @@ class Game:
         # Ring
         RingRenderer.draw(self.screen, offset)
 
+        dirty = self._dirty
+
         # Fighters
         if self.fighter1:
-            SpriteRenderer.draw_fighter(self.screen, self.fighter1, offset)
+            dirty.append(SpriteRenderer.draw_fighter(self.screen, self.fighter1, offset, self.tick))
         if self.fighter2:
-            SpriteRenderer.draw_fighter(self.screen, self.fighter2, offset)
+            dirty.append(SpriteRenderer.draw_fighter(self.screen, self.fighter2, offset, self.tick))
 
         # Particles
-        self.particles.draw(self.screen)
+        particle_rect = self.particles.draw(self.screen)
+        if particle_rect is not None:
+            dirty.append(particle_rect)
 
         # Damage popups
         for popup in self.damage_popups:
-            popup.draw(self.screen, self.font_medium)
+            popup_rect = popup.draw(self.screen, self.font_medium)
+            if popup_rect is not None:
+                dirty.append(popup_rect)
+
+        # Header, panels, bars and the text box change from frame to frame
+        dirty.append(self._hud_rect)
+        dirty.append(self._text_box_rect)
 
         # UI - Header
         header_rect = pygame.Rect(0, 0, SCREEN_WIDTH, 80)
@@ -2098,21 +3319,22 @@ class Game:
         pygame.draw.line(self.screen, CYAN, (0, 80), (SCREEN_WIDTH, 80), 2)
 
         # Round info
-        round_text = self.font_medium.render(f"ROUND {self.round_number}", True, WHITE)
-        self.screen.blit(round_text, (50, 20))
+        if self.round_number != self._round_shown:
+            self._round_surf = self.font_medium.render(f"ROUND {self.round_number}", True, WHITE)
+            self._round_shown = self.round_number
+        self.screen.blit(self._round_surf, (50, 20))
 
         # Timer
         time_secs = self.round_timer // FPS
-        mins = time_secs // 60
-        secs = time_secs % 60
-        timer_text = self.font_large.render(f"{mins:02d}:{secs:02d}", True, GOLD)
-        timer_rect = timer_text.get_rect(center=(SCREEN_WIDTH // 2, 40))
-        self.screen.blit(timer_text, timer_rect)
+        if time_secs != self._time_shown:
+            mins, secs = divmod(time_secs, 60)
+            self._timer_surf = self.font_large.render(f"{mins:02d}:{secs:02d}", True, GOLD)
+            self._timer_rect = self._timer_surf.get_rect(center=(SCREEN_WIDTH // 2, 40))
+            self._time_shown = time_secs
+        self.screen.blit(self._timer_surf, self._timer_rect)
 
         # Title
-        title = self.font_medium.render("SYNTAX BRAWLERS", True, CYAN)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 65))
-        self.screen.blit(title, title_rect)
+        self.screen.blit(self._header_title_surf, self._header_title_rect)
 
         # Fighter info panels
         if self.fighter1:
@@ -2127,11 +3349,12 @@ class Game:
         self.stamina_bar2.draw(self.screen)
 
         # Score
-        score_text = self.font_medium.render(
-            f"{self.rounds_won[1]} - {self.rounds_won[2]}", True, WHITE
-        )
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 15))
-        self.screen.blit(score_text, score_rect)
+        score = (self.rounds_won[1], self.rounds_won[2])
+        if score != self._score_shown:
+            self._score_surf = self.font_medium.render(f"{score[0]} - {score[1]}", True, WHITE)
+            self._score_rect = self._score_surf.get_rect(center=(SCREEN_WIDTH // 2, 15))
+            self._score_shown = score
+        self.screen.blit(self._score_surf, self._score_rect)
 
         # Text box
         self.text_box.draw(self.screen, self.font_small)
@@ -2139,40 +3362,27 @@ class Game:
         # Footer controls
         footer_rect = pygame.Rect(0, SCREEN_HEIGHT - 30, SCREEN_WIDTH, 30)
         pygame.draw.rect(self.screen, (20, 20, 40), footer_rect)
-        controls = "[ESC] Pause  |  [R] Restart  |  [SPACE] Skip Text"
-        controls_text = self.font_small.render(controls, True, GRAY)
-        controls_rect = controls_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 15))
-        self.screen.blit(controls_text, controls_rect)
+        self.screen.blit(self._controls_surf, self._controls_rect)
 
         # Paused overlay
         if self.state == GameState.PAUSED:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            self.screen.blit(overlay, (0, 0))
-
-            pause_text = self.font_large.render("PAUSED", True, WHITE)
-            pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-            self.screen.blit(pause_text, pause_rect)
+            self.screen.blit(self._overlays[180], (0, 0))
 
-            resume = self.font_medium.render("Press ESC to resume", True, GRAY)
-            resume_rect = resume.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-            self.screen.blit(resume, resume_rect)
+            self.screen.blit(self._pause_surf, self._pause_rect)
+            self.screen.blit(self._resume_surf, self._resume_rect)
 
         # Round end overlay
         elif self.state == GameState.ROUND_END:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self._overlays[150], (0, 0))
 
-            round_end = self.font_large.render(f"ROUND {self.round_number} OVER", True, GOLD)
-            round_rect = round_end.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-            self.screen.blit(round_end, round_rect)
+            self.screen.blit(*_overlay_text(
+                self.font_large, f"ROUND {self.round_number} OVER", GOLD,
+                (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+            ))
 
         # Match end overlay
         elif self.state == GameState.MATCH_END:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 200))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self._overlays[200], (0, 0))
 
             # Determine winner
             if self.rounds_won[1] > self.rounds_won[2]:
@@ -2185,23 +3395,15 @@ class Game:
                 winner = "DRAW"
                 color = GRAY
 
-            win_text = self.font_large.render("WINNER!", True, GOLD)
-            win_rect = win_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-            self.screen.blit(win_text, win_rect)
-
-            name_text = self.font_large.render(winner, True, color)
-            name_rect = name_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
-            self.screen.blit(name_text, name_rect)
-
-            score_text = self.font_medium.render(
-                f"Final Score: {self.rounds_won[1]} - {self.rounds_won[2]}", True, WHITE
-            )
-            score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 80))
-            self.screen.blit(score_text, score_rect)
-
-            restart = self.font_medium.render("Press R to restart or ESC for menu", True, GRAY)
-            restart_rect = restart.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 130))
-            self.screen.blit(restart, restart_rect)
+            self.screen.blit(self._winner_surf, self._winner_rect)
+            self.screen.blit(*_overlay_text(
+                self.font_large, winner, color, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20)
+            ))
+            self.screen.blit(*_overlay_text(
+                self.font_medium, f"Final Score: {self.rounds_won[1]} - {self.rounds_won[2]}", WHITE,
+                (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 80)
+            ))
+            self.screen.blit(self._restart_surf, self._restart_rect)
 
     def _render_fighter_panel(self, fighter: Fighter, x: int, y: int, align: str):
         """Render fighter info panel"""
@@ -2273,12 +3475,12 @@ def main():
     print("  Or run Ollama locally at http://localhost:11434")
     print()
 
-    # Create event loop for async operations (Python 3.10+ compatible)
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-
     game = Game()
-    game.run()
+    try:
+        game.run()
+    finally:
+        game.loop.run_until_complete(BaseLLMProvider.close_client())
+        game.loop.close()
 
 
 if __name__ == "__main__":
@@ -5,5 +5,8 @@ AI System Module
 from ai.controller import AIController
 from ai.personality import PersonalityManager, PERSONALITIES
 from ai.fallback import FallbackAI
+from ai.llm_batcher import LLMBatcher
+from ai.fair_provider import FairLLMProvider
 
-__all__ = ['AIController', 'PersonalityManager', 'PERSONALITIES', 'FallbackAI']
+__all__ = ['AIController', 'PersonalityManager', 'PERSONALITIES', 'FallbackAI',
+           'LLMBatcher', 'FairLLMProvider']
@@ -5,19 +5,55 @@ Main controller yang mengintegrasikan LLM dan Fallback AI.
 """
 
 import asyncio
+import logging
+import time
+from bisect import bisect_right
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 import sys
 sys.path.insert(0, '..')
 
-from config import ActionType, LLM_TIMEOUT
+# Timeout tanpa Task pembungkus: asyncio.timeout (3.11+) atau async_timeout
+try:
+    from asyncio import timeout as llm_timeout
+except ImportError:
+    try:
+        from async_timeout import timeout as llm_timeout
+    except ImportError:
+        llm_timeout = None
+
+from config import ActionType, LLM_TIMEOUT, LLM_CACHE_SIZE, LLM_HEDGE_DELAY, DATACLASS_SLOTS
 from ai.providers.base import BaseLLMProvider, LLMResponse
 from ai.personality import PersonalityManager
+from ai.fallback import FallbackAI, GameStateTuple
+from ai.llm_batcher import LLMBatcher
+from ai.fair_provider import FairLLMProvider
+
+_log = logging.getLogger(__name__)
+
+# Saat LLM terus gagal, warning paling banyak sekali per interval ini (detik)
+ERROR_LOG_INTERVAL = 5.0
+
+# Batas jarak (px) dan nama bucket-nya
+DISTANCE_THRESHOLDS = (60, 140, 200)
+DISTANCE_NAMES = ('clinch', 'punch', 'medium', 'far')
+
+# Personality yang sengaja acak; jawaban LLM-nya tidak di-cache
+UNCACHED_PERSONALITIES = frozenset({'wildcard'})
 
+# Action dari LLM yang bisa dijalankan fighter (CLINCH tidak termasuk)
+_ACTION_STR_MAP = {
+    action.value: action
+    for action in (ActionType.JAB, ActionType.CROSS, ActionType.HOOK, ActionType.UPPERCUT,
+                   ActionType.BLOCK, ActionType.DODGE, ActionType.IDLE)
+}
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class AIDecision:
     """Final AI decision"""
+
     action: ActionType
     reasoning: str
     trash_talk: str
@@ -28,188 +64,360 @@ class AIDecision:
 class AIController:
     """
     Controller utama untuk AI fighter.
-    Menggunakan LLM jika tersedia, fallback jika tidak.
+    Menggunakan LLM jika tersedia; dengan use_fallback=True,
+    rule-based AI dipakai saat LLM tidak ada atau gagal.
+    Controller yang berbagi batcher mengirim request async-nya bersama.
     """
 
+    __slots__ = (
+        'fighter', 'llm_provider', 'batcher', 'personality_name', 'personality',
+        '_personality_desc', 'fallback',
+        '_pending_decision', '_next_decision_time', '_min_decision_interval',
+        '_last_llm_response', '_llm_available', '_next_llm_check_time',
+        '_recheck_evt', '_recheck_task',
+        '_llm_cache', '_llm_cache_enabled', '_llm_task', '_llm_task_key',
+        '_gs_key', '_gs_cache', '_gs_tuple',
+        '_err_last', '_err_suppressed',
+        'decisions_made', 'llm_decisions', 'fallback_decisions',
+    )
+
     def __init__(self, fighter, llm_provider: Optional[BaseLLMProvider] = None,
-                 personality: str = 'balanced'):
+                 personality: str = 'balanced', use_fallback: bool = False,
+                 batcher: Optional[LLMBatcher] = None):
         self.fighter = fighter
         self.llm_provider = llm_provider
+        self.batcher = batcher
         self.personality_name = personality
         self.personality = PersonalityManager(personality)
+        # Deskripsi untuk prompt hanya bergantung pada nama personality
+        self._personality_desc = self.personality.get_description()
+        self.fallback: Optional[FallbackAI] = FallbackAI(personality) if use_fallback else None
 
         # State
         self._pending_decision: Optional[AIDecision] = None
-        self._decision_cooldown = 0.0
+        # Cooldown sebagai waktu absolut (time.monotonic), bukan hitung mundur per frame
+        self._next_decision_time = 0.0
         self._min_decision_interval = 0.5  # 500ms between LLM calls
 
         # LLM state
         self._last_llm_response: Optional[LLMResponse] = None
         self._llm_available = False
-        self._llm_check_cooldown = 0.0
+        self._next_llm_check_time: Optional[float] = None
+        # Jawaban LLM per state (LRU), supaya state yang berulang tidak query lagi
+        self._llm_cache: "OrderedDict[tuple, LLMResponse]" = OrderedDict()
+        self._llm_cache_enabled = self.personality_name not in UNCACHED_PERSONALITIES
+        # Request LLM yang masih jalan setelah kalah race dengan fallback
+        self._llm_task: Optional[asyncio.Task] = None
+        self._llm_task_key: Optional[tuple] = None
+        # Satu task background yang menunggu event, bukan task baru tiap re-check
+        self._recheck_evt: Optional[asyncio.Event] = None
+        self._recheck_task: Optional[asyncio.Task] = None
+
+        # Game state terakhir, dipakai ulang selama fingerprint-nya sama
+        self._gs_key: Optional[tuple] = None
+        self._gs_cache: Optional[Dict[str, Any]] = None
+        self._gs_tuple: Optional[GameStateTuple] = None
+
+        # Rate limit untuk log error
+        self._err_last = float('-inf')
+        self._err_suppressed = 0
 
         # Stats
         self.decisions_made = 0
         self.llm_decisions = 0
+        self.fallback_decisions = 0
 
     async def initialize(self):
         """Initialize controller (check LLM availability)"""
+        if self._recheck_task is None or self._recheck_task.done():
+            self._recheck_evt = asyncio.Event()
+            self._recheck_task = asyncio.create_task(self._recheck_loop())
         if self.llm_provider:
+            await self.llm_provider.ensure_session()
             self._llm_available = await self.llm_provider.check_availability()
 
     def get_action(self, fighter, opponent, round_time: float) -> Optional[ActionType]:
         """
-        Synchronous action getter - ONLY uses LLM, no fallback.
+        Synchronous action getter - LLM first, fallback only if enabled.
         """
         if not fighter.can_act:
             return None
 
-        if self._decision_cooldown > 0:
-            return None
+        if time.monotonic() < self._next_decision_time:
+            return self._quick_react(fighter, opponent, round_time)
 
         # Build game state
         game_state = self._build_game_state(fighter, opponent, round_time)
 
-        # ONLY use LLM - no fallback
+        # LLM first
         if self.llm_provider and hasattr(self.llm_provider, 'get_action_sync'):
             try:
-                response = self.llm_provider.get_action_sync(
-                    game_state,
-                    self.personality.get_description()
-                )
-
-                self._decision_cooldown = self._min_decision_interval
+                key = self._llm_cache_key(game_state)
+                response = self._cached_response(key)
+                if response is None:
+                    response = self.llm_provider.get_action_sync(
+                        game_state,
+                        self._personality_desc
+                    )
+                    self._store_response(key, response)
+
+                self._set_cooldown(self._min_decision_interval)
                 self.decisions_made += 1
                 self.llm_decisions += 1
 
                 if response:
                     self._last_llm_response = response
                     action = self._convert_action_string(response.action)
-                    print(f"[{fighter.name}] LLM: {response.action} - {response.reasoning}")
+                    _log.debug("[%s] LLM: %s - %s", fighter.name, response.action, response.reasoning)
                     return action
 
             except Exception as e:
-                print(f"[{fighter.name}] LLM Error: {e}")
-                self._decision_cooldown = 0.5  # Wait before retry
+                self._log_error("[%s] LLM Error: %s", fighter.name, e)
+                self._set_cooldown(0.5)  # Wait before retry
 
-        return None  # No action if LLM fails - NO FALLBACK
+        return self._fallback_action(game_state)
 
     async def get_action_async(self, fighter, opponent,
                                round_time: float) -> Optional[ActionType]:
         """
-        Async action getter - ONLY uses LLM, no fallback.
+        Async action getter - LLM first, fallback only if enabled.
+        Dengan fallback, LLM hanya ditunggu LLM_HEDGE_DELAY detik.
         """
         if not fighter.can_act:
             return None
 
-        if self._decision_cooldown > 0:
-            self._decision_cooldown -= 0.016  # Approximate frame time
-            return None
+        if time.monotonic() < self._next_decision_time:
+            return self._quick_react(fighter, opponent, round_time)
 
         # Build game state
         game_state = self._build_game_state(fighter, opponent, round_time)
 
-        # ONLY use LLM - no fallback
+        # LLM first
         if self.llm_provider:
             try:
-                response = await asyncio.wait_for(
-                    self.llm_provider.get_action(game_state,
-                                                 self.personality.get_description()),
-                    timeout=LLM_TIMEOUT
-                )
-
-                self._decision_cooldown = self._min_decision_interval
+                key = self._llm_cache_key(game_state)
+                response = self._cached_response(key)
+                if response is None and self.fallback is not None:
+                    response = await self._hedged_request(key, game_state)
+                    if response is None:
+                        return self._fallback_action(game_state)
+                elif response is None:
+                    response = await self._request_llm(game_state)
+                    self._store_response(key, response)
+
+                self._set_cooldown(self._min_decision_interval)
                 self.decisions_made += 1
                 self.llm_decisions += 1
 
                 if response:
                     self._last_llm_response = response
                     action = self._convert_action_string(response.action)
-                    print(f"[{fighter.name}] LLM: {response.action} - {response.reasoning}")
+                    _log.debug("[%s] LLM: %s - %s", fighter.name, response.action, response.reasoning)
                     return action
 
             except asyncio.TimeoutError:
-                print(f"[{fighter.name}] LLM Timeout - retrying...")
-                self._decision_cooldown = 0.5
+                self._log_error("[%s] LLM Timeout - retrying...", fighter.name)
+                self._set_cooldown(0.5)
 
             except Exception as e:
-                print(f"[{fighter.name}] LLM Error: {e}")
-                self._decision_cooldown = 0.5
+                self._log_error("[%s] LLM Error: %s", fighter.name, e)
+                self._set_cooldown(0.5)
+
+        return self._fallback_action(game_state)
+
+    async def _request_llm(self, game_state: Dict[str, Any]) -> LLMResponse:
+        """Satu request LLM, dibatasi LLM_TIMEOUT"""
+        if self.batcher is not None:
+            request = self.batcher.submit(game_state, self._personality_desc)
+        elif isinstance(self.llm_provider, FairLLMProvider):
+            # Provider bersama: antri per fighter, bukan FIFO global
+            request = self.llm_provider.get_action(game_state, self._personality_desc,
+                                                   client_id=id(self.fighter))
+        else:
+            request = self.llm_provider.get_action(game_state, self._personality_desc)
+        if llm_timeout is not None:
+            async with llm_timeout(LLM_TIMEOUT):
+                return await request
+        return await asyncio.wait_for(request, timeout=LLM_TIMEOUT)
+
+    async def _hedged_request(self, key: tuple,
+                              game_state: Dict[str, Any]) -> Optional[LLMResponse]:
+        """
+        Tunggu LLM paling lama LLM_HEDGE_DELAY; None berarti pakai fallback.
+        Request yang terlambat tetap jalan dan hasilnya masuk cache.
+        """
+        task = self._llm_task
+        if task is None or task.done():
+            task = asyncio.create_task(self._request_llm(game_state))
+            task.add_done_callback(self._on_llm_done)
+            self._llm_task, self._llm_task_key = task, key
+        elif self._llm_task_key != key:
+            # Masih menunggu jawaban untuk state lain
+            return None
 
-        return None  # No action if LLM fails - NO FALLBACK
+        done, _ = await asyncio.wait({task}, timeout=LLM_HEDGE_DELAY)
+        if task not in done:
+            return None
+        return task.result()
+
+    def _on_llm_done(self, task: asyncio.Task):
+        """Simpan jawaban request hedged ke cache, termasuk yang terlambat"""
+        if task.cancelled():
+            return
+        if task.exception() is None and task is self._llm_task:
+            self._store_response(self._llm_task_key, task.result())
+
+    def _llm_cache_key(self, game_state: Dict[str, Any]) -> tuple:
+        """Fingerprint kasar dari game state untuk cache jawaban LLM"""
+        return (
+            round(game_state['my_health'] / 10),
+            round(game_state['my_stamina'] / 10),
+            game_state['distance'],
+            game_state['opp_action'],
+            game_state['my_last_action'],
+            min(game_state['combo_count'], 5),
+        )
+
+    def _cached_response(self, key: tuple) -> Optional[LLMResponse]:
+        """Ambil jawaban dari cache (None kalau miss atau cache mati)"""
+        if not self._llm_cache_enabled:
+            return None
+        response = self._llm_cache.get(key)
+        if response is not None:
+            self._llm_cache.move_to_end(key)
+        return response
+
+    def _store_response(self, key: tuple, response: Optional[LLMResponse]):
+        """Simpan jawaban yang valid, buang yang paling lama dipakai kalau penuh"""
+        if not self._llm_cache_enabled or not response or response.error:
+            return
+        self._llm_cache[key] = response
+        if len(self._llm_cache) > LLM_CACHE_SIZE:
+            self._llm_cache.popitem(last=False)
+
+    def _log_error(self, msg: str, *args):
+        """Warning dengan rate limit; yang terlewat dihitung dan dilaporkan berikutnya"""
+        now = time.monotonic()
+        if now - self._err_last < ERROR_LOG_INTERVAL:
+            self._err_suppressed += 1
+            return
+
+        if self._err_suppressed:
+            msg += " (%d similar messages suppressed)"
+            args += (self._err_suppressed,)
+        _log.warning(msg, *args)
+        self._err_last = now
+        self._err_suppressed = 0
+
+    def _quick_react(self, fighter, opponent, round_time: float) -> Optional[ActionType]:
+        """Respon serangan lawan selama cooldown (hanya kalau fallback aktif)"""
+        if self.fallback is None:
+            return None
 
-    def _build_game_state(self, fighter, opponent, round_time: float) -> Dict[str, Any]:
-        """Build game state dict untuk AI"""
-        # Calculate distance
-        distance_px = abs(fighter.x - opponent.x)
-
-        if distance_px < 60:
-            distance = 'clinch'
-        elif distance_px < 140:
-            distance = 'punch'
-        elif distance_px < 200:
-            distance = 'medium'
-        else:
-            distance = 'far'
+        decision = self.fallback.quick_react(
+            self._build_game_state_tuple(fighter, opponent, round_time)
+        )
+        return decision.action if decision else None
 
-        # Get opponent action
-        opp_action = 'idle'
-        if hasattr(opponent, 'current_action') and opponent.current_action:
-            opp_action = opponent.current_action.action_type.value
+    def _fallback_action(self, game_state: Dict[str, Any]) -> Optional[ActionType]:
+        """Action dari fallback AI, atau None kalau fallback tidak aktif"""
+        if self.fallback is None:
+            return None
 
-        # Get last action
-        my_last = 'none'
-        if hasattr(fighter, 'last_action') and fighter.last_action:
-            my_last = fighter.last_action.value
+        # Dict dari _build_game_state punya pasangan tuple yang lebih murah dibaca
+        state = self._gs_tuple if game_state is self._gs_cache else game_state
+        decision = self.fallback.get_action(state)
+        self._set_cooldown(self._min_decision_interval)
+        self.decisions_made += 1
+        self.fallback_decisions += 1
+        return decision.action
 
-        return {
-            'my_health': fighter.health_percent * 100,
-            'my_stamina': fighter.stamina_percent * 100,
-            'opp_health': opponent.health_percent * 100,
-            'opp_stamina': opponent.stamina_percent * 100,
-            'distance': distance,
-            'distance_px': distance_px,
-            'opp_action': opp_action,
-            'my_last_action': my_last,
-            'combo_count': fighter.stats.combo_count,
-            'round_time': round_time,
-            'can_act': fighter.can_act,
-            'my_position': fighter.x,
-            'opp_position': opponent.x,
-        }
+    def _build_game_state(self, fighter, opponent, round_time: float) -> Dict[str, Any]:
+        """Build game state dict untuk AI"""
+        # Semua property dibaca sekali; fingerprint dan dict memakai nilai yang sama
+        my_x, opp_x = fighter.x, opponent.x
+        my_health, opp_health = fighter.health_percent, opponent.health_percent
+        my_stamina, opp_stamina = fighter.stamina_percent, opponent.stamina_percent
+        opp_current = getattr(opponent, 'current_action', None)
+        my_last_action = getattr(fighter, 'last_action', None)
+        combo_count = fighter.stats.combo_count
+        can_act = fighter.can_act
+
+        # Pakai ulang dict sebelumnya kalau state belum berubah
+        key = (my_x, opp_x, my_health, opp_health, my_stamina, opp_stamina,
+               opp_current, my_last_action, combo_count, can_act, int(round_time * 10))
+        if key == self._gs_key:
+            return self._gs_cache
 
-    def _convert_action(self, action: ActionType) -> ActionType:
-        """Convert fallback action to ActionType"""
-        return action
+        # Calculate distance
+        distance_px = abs(my_x - opp_x)
+
+        # Tuple untuk fallback dan dict untuk prompt LLM, dari nilai yang sama
+        state = GameStateTuple(
+            my_health * 100, my_stamina * 100, opp_health * 100, opp_stamina * 100,
+            DISTANCE_NAMES[bisect_right(DISTANCE_THRESHOLDS, distance_px)], distance_px,
+            opp_current.action_type.value if opp_current else 'idle',
+            my_last_action.value if my_last_action else 'none',
+            combo_count, round_time, can_act, my_x, opp_x
+        )
+        self._gs_key = key
+        self._gs_tuple = state
+        self._gs_cache = dict(zip(GameStateTuple._fields, state))
+        return self._gs_cache
+
+    def _build_game_state_tuple(self, fighter, opponent,
+                                round_time: float) -> GameStateTuple:
+        """Game state sebagai GameStateTuple (untuk fallback AI)"""
+        self._build_game_state(fighter, opponent, round_time)
+        return self._gs_tuple
 
     def _convert_action_string(self, action_str: str) -> ActionType:
         """Convert string action to ActionType"""
-        mapping = {
-            'JAB': ActionType.JAB,
-            'CROSS': ActionType.CROSS,
-            'HOOK': ActionType.HOOK,
-            'UPPERCUT': ActionType.UPPERCUT,
-            'BLOCK': ActionType.BLOCK,
-            'DODGE': ActionType.DODGE,
-            'IDLE': ActionType.IDLE,
-        }
-        return mapping.get(action_str.upper(), ActionType.IDLE)
+        # Provider sudah menormalkan ke uppercase; upper() hanya kalau belum
+        action = _ACTION_STR_MAP.get(action_str)
+        if action is None:
+            action = _ACTION_STR_MAP.get(action_str.upper(), ActionType.IDLE)
+        return action
+
+    def _set_cooldown(self, seconds: float):
+        """Keputusan berikutnya paling cepat `seconds` detik dari sekarang"""
+        self._next_decision_time = time.monotonic() + seconds
 
     def update(self, dt: float):
         """Update controller state"""
-        if self._decision_cooldown > 0:
-            self._decision_cooldown -= dt
-
-        if self._llm_check_cooldown > 0:
-            self._llm_check_cooldown -= dt
-            if self._llm_check_cooldown <= 0 and self.llm_provider:
+        if (self._next_llm_check_time is not None
+                and time.monotonic() >= self._next_llm_check_time):
+            self._next_llm_check_time = None
+            if self.llm_provider:
                 # Re-check LLM availability
-                asyncio.create_task(self._recheck_llm())
-
-    async def _recheck_llm(self):
-        """Re-check LLM availability"""
-        if self.llm_provider:
-            self._llm_available = await self.llm_provider.check_availability()
+                self._request_recheck()
+
+    def _request_recheck(self):
+        """Bangunkan task re-check (tidak ada efek sebelum initialize)"""
+        if self._recheck_evt is not None:
+            self._recheck_evt.set()
+
+    async def _recheck_loop(self):
+        """Re-check LLM availability setiap kali diminta"""
+        while True:
+            await self._recheck_evt.wait()
+            self._recheck_evt.clear()
+            if self.llm_provider:
+                try:
+                    self._llm_available = await self.llm_provider.check_availability()
+                except Exception as e:
+                    self._log_error("LLM re-check error: %s", e)
+                    self._llm_available = False
+
+    def shutdown(self):
+        """Stop task re-check dan request LLM yang masih jalan"""
+        if self._recheck_task is not None:
+            self._recheck_task.cancel()
+            self._recheck_task = None
+        self._recheck_evt = None
+        if self._llm_task is not None:
+            self._llm_task.cancel()
+            self._llm_task = None
 
     def get_last_trash_talk(self) -> str:
         """Get last trash talk"""
@@ -226,14 +434,20 @@ class AIController:
     def reset(self):
         """Reset untuk round/match baru"""
         self._pending_decision = None
-        self._decision_cooldown = 0
+        self._next_decision_time = 0.0
+        self._gs_key = None
+        self._gs_cache = None
+        self._gs_tuple = None
         self.personality.reset()
+        if self.fallback is not None:
+            self.fallback.reset()
 
     def get_stats(self) -> Dict[str, Any]:
         """Get AI stats"""
         return {
             'decisions_made': self.decisions_made,
             'llm_decisions': self.llm_decisions,
+            'fallback_decisions': self.fallback_decisions,
             'personality': self.personality_name,
         }
 
@@ -241,4 +455,7 @@ class AIController:
         """Set LLM provider"""
         self.llm_provider = provider
         self._llm_available = False
-        asyncio.create_task(self.initialize())
+        if self._recheck_task is not None and not self._recheck_task.done():
+            self._request_recheck()
+        else:
+            asyncio.create_task(self.initialize())
@@ -0,0 +1,126 @@
+"""
+Fair LLM Provider
+=================
+Wrapper provider yang membagi satu LLM provider secara adil antar fighter
+(deficit round-robin), supaya fighter dengan request lambat tidak
+membuat fighter lain menunggu di antrian FIFO.
+"""
+
+import asyncio
+from collections import deque
+from typing import Dict, Any, Deque, Hashable, List, Optional, Tuple
+import sys
+sys.path.insert(0, '..')
+
+from ai.providers.base import BaseLLMProvider, LLMResponse
+
+
+class FairLLMProvider(BaseLLMProvider):
+    """
+    Deficit round-robin scheduler di depan provider lain.
+    Tiap client (fighter) punya antrian sendiri; setiap giliran client
+    mendapat `quantum` kredit dan request jalan selama kreditnya cukup.
+    """
+
+    def __init__(self, provider: BaseLLMProvider, quantum: float = 1.0,
+                 max_concurrent: int = BaseLLMProvider.MAX_CONNECTIONS):
+        super().__init__(provider.api_key, provider.model)
+        self.provider = provider
+        self.quantum = quantum
+        self.max_concurrent = max_concurrent
+
+        self._queues: Dict[Hashable, Deque[Tuple[Dict[str, Any], str, float, asyncio.Future]]] = {}
+        self._deficits: Dict[Hashable, float] = {}
+        self._active: Deque[Hashable] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._running: List[asyncio.Task] = []
+
+    async def get_action(self, game_state: Dict[str, Any], personality: str,
+                         client_id: Hashable = None, cost: float = 1.0) -> LLMResponse:
+        """Antrikan request untuk client_id dan tunggu giliran"""
+        if self._dispatcher is None or self._dispatcher.done():
+            self._wakeup = asyncio.Event()
+            self._slots = asyncio.Semaphore(self.max_concurrent)
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        queue = self._queues.get(client_id)
+        if queue is None:
+            queue = self._queues[client_id] = deque()
+            self._deficits[client_id] = 0.0
+        if client_id not in self._active:
+            self._active.append(client_id)
+
+        future = asyncio.get_running_loop().create_future()
+        queue.append((game_state, personality, cost, future))
+        self._wakeup.set()
+        return await future
+
+    async def _dispatch(self):
+        """Gilir client aktif dan jalankan request yang kreditnya cukup"""
+        while True:
+            if not self._active:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            client_id = self._active.popleft()
+            queue = self._queues[client_id]
+            self._deficits[client_id] += self.quantum
+
+            while queue and self._deficits[client_id] >= queue[0][2]:
+                game_state, personality, cost, future = queue.popleft()
+                self._deficits[client_id] -= cost
+                if future.done():
+                    continue  # Caller sudah timeout
+                await self._slots.acquire()
+                task = asyncio.create_task(self._call(game_state, personality, future))
+                self._running.append(task)
+                task.add_done_callback(self._running.remove)
+                # Caller timeout / cancel: hentikan request supaya slot cepat bebas
+                future.add_done_callback(
+                    lambda f, task=task: task.cancel() if f.cancelled() else None
+                )
+
+            if queue:
+                if client_id not in self._active:
+                    self._active.append(client_id)
+            else:
+                # Client yang antriannya kosong tidak menabung kredit
+                self._deficits[client_id] = 0.0
+
+    async def _call(self, game_state: Dict[str, Any], personality: str,
+                    future: asyncio.Future):
+        """Satu request ke provider asli"""
+        try:
+            result = await self.provider.get_action(game_state, personality)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+        finally:
+            self._slots.release()
+
+    async def check_availability(self) -> bool:
+        """Availability mengikuti provider asli"""
+        self.is_available = await self.provider.check_availability()
+        self.last_error = self.provider.last_error
+        return self.is_available
+
+    def close(self):
+        """Stop dispatcher, batalkan request yang masih antri, tutup provider asli"""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+        for task in list(self._running):
+            task.cancel()
+        for queue in self._queues.values():
+            for _, _, _, future in queue:
+                future.cancel()
+            queue.clear()
+        self._active.clear()
+        if hasattr(self.provider, 'close'):
+            self.provider.close()
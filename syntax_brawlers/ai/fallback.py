@@ -5,18 +5,99 @@ AI lokal yang digunakan ketika LLM tidak tersedia.
 Berbasis rule dan weighted random.
 """
 
-from typing import Dict, Any, Optional, Tuple
+import random
+from bisect import bisect_right
+from collections import namedtuple
+from typing import Dict, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 import sys
 sys.path.insert(0, '..')
 
-from config import ActionType, ACTION_DATA
+from config import ActionType, ACTION_DATA, DATACLASS_SLOTS
 from ai.personality import PersonalityManager, TRASH_TALK
 
-
-@dataclass
+# Game state ringkas untuk fallback: akses field, bukan lookup dict
+GameStateTuple = namedtuple(
+    'GameStateTuple',
+    'my_health my_stamina opp_health opp_stamina distance distance_px '
+    'opp_action my_last_action combo_count round_time can_act my_position opp_position',
+    defaults=(100, 100, 100, 100, 'medium', 200, 'idle', 'none', 0, 0.0, True, 0, 0)
+)
+
+
+def game_state_tuple(game_state: Dict[str, Any]) -> GameStateTuple:
+    """Convert game state dict (format LLM) ke GameStateTuple"""
+    return GameStateTuple._make(
+        game_state.get(field, default)
+        for field, default in zip(GameStateTuple._fields, GameStateTuple._field_defaults.values())
+    )
+
+
+Decision = Tuple[ActionType, str, float]
+
+# opp_action yang perlu direspon segera
+ATTACK_ACTIONS = frozenset({'JAB', 'CROSS', 'HOOK', 'UPPERCUT'})
+StaminaTable = Tuple[Tuple[float, ...], Tuple[Decision, ...]]
+
+
+def _stamina_table(*rows: Tuple[float, ActionType, str, float]) -> StaminaTable:
+    """Rows (min stamina, action, reasoning, confidence) jadi tabel untuk bisect"""
+    rows = sorted(rows, key=lambda row: row[0])
+    return tuple(row[0] for row in rows), tuple(row[1:] for row in rows)
+
+
+def _pick(table: StaminaTable, stamina: float) -> Decision:
+    """Decision dengan threshold tertinggi yang masih terjangkau stamina"""
+    thresholds, decisions = table
+    return decisions[bisect_right(thresholds, stamina) - 1]
+
+
+_ANY = float('-inf')
+
+# Habisi lawan yang hampir KO
+_FINISH_TABLE = _stamina_table(
+    (35, ActionType.UPPERCUT, "Finish with uppercut!", 0.8),
+    (28, ActionType.HOOK, "Finish with hook!", 0.8),
+    (18, ActionType.CROSS, "Finish with cross!", 0.8),
+    (8, ActionType.JAB, "Finish with jab!", 0.8),
+    (_ANY, ActionType.IDLE, "Waiting to finish", 0.6),
+)
+
+# HP sendiri kritis: main aman
+_DESPERATE_TABLE = _stamina_table(
+    (15, ActionType.DODGE, "Survival dodge", 0.7),
+    (12, ActionType.BLOCK, "Survival block", 0.7),
+    (_ANY, ActionType.IDLE, "Desperate recovery", 0.5),
+)
+
+# HP sendiri kritis tapi lawan juga hampir KO dan dalam jangkauan
+_DESPERATE_FINISH_TABLE = _stamina_table(
+    (35, ActionType.UPPERCUT, "Desperate uppercut!", 0.6),
+    (28, ActionType.HOOK, "Desperate hook!", 0.6),
+    (15, ActionType.DODGE, "Survival dodge", 0.7),
+    (12, ActionType.BLOCK, "Survival block", 0.7),
+    (_ANY, ActionType.IDLE, "Desperate recovery", 0.5),
+)
+
+# Prioritas: uppercut > hook > jab berdasarkan stamina
+_CLINCH_TABLE = _stamina_table(
+    (35, ActionType.UPPERCUT, "Clinch uppercut", 0.7),
+    (28, ActionType.HOOK, "Short hook", 0.75),
+    (8, ActionType.JAB, "Body jab", 0.8),
+    (_ANY, ActionType.JAB, "Quick jab", 0.6),
+)
+
+# Punch range tanpa combo yang sedang jalan
+_PUNCH_TABLE = _stamina_table(
+    (8, ActionType.JAB, "Starting combo", 0.7),
+    (_ANY, ActionType.JAB, "In range attack", 0.7),
+)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class FallbackDecision:
     """Decision dari fallback AI"""
+
     action: ActionType
     reasoning: str
     trash_talk: str
@@ -29,23 +110,39 @@ class FallbackAI:
     Digunakan ketika LLM tidak tersedia atau timeout.
     """
 
-    def __init__(self, personality: str = 'balanced'):
-        self.personality = PersonalityManager(personality)
+    __slots__ = ('_rng', 'personality', '_last_action', '_consecutive_same',
+                 '_combo_sequence', '_dist_dispatch')
+
+    def __init__(self, personality: str = 'balanced', seed: Optional[int] = None):
+        # RNG per instance; dengan seed, keputusan bisa di-replay
+        self._rng = random.Random(seed)
+        self.personality = PersonalityManager(personality, rng=self._rng)
         self._last_action: Optional[ActionType] = None
         self._consecutive_same = 0
         self._combo_sequence: list = []
 
-    def get_action(self, game_state: Dict[str, Any]) -> FallbackDecision:
+        # Aksi per jarak, satu lookup dict
+        self._dist_dispatch = {
+            'far': self._far_action,
+            'clinch': self._clinch_action,
+            'punch': self._punch_range_action,
+            'medium': self._medium_range_action,
+        }
+
+    def get_action(self, game_state: Union[GameStateTuple, Dict[str, Any]]) -> FallbackDecision:
         """Get action berdasarkan game state"""
+        if isinstance(game_state, dict):
+            game_state = game_state_tuple(game_state)
+
         # Extract state
-        my_health = game_state.get('my_health', 100)
-        my_stamina = game_state.get('my_stamina', 100)
-        opp_health = game_state.get('opp_health', 100)
-        opp_stamina = game_state.get('opp_stamina', 100)
-        distance = game_state.get('distance', 'medium')
-        distance_px = game_state.get('distance_px', 200)
-        opp_action = game_state.get('opp_action', 'idle')
-        can_act = game_state.get('can_act', True)
+        my_health = game_state.my_health
+        my_stamina = game_state.my_stamina
+        opp_health = game_state.opp_health
+        opp_stamina = game_state.opp_stamina
+        distance = game_state.distance
+        distance_px = game_state.distance_px
+        opp_action = game_state.opp_action
+        can_act = game_state.can_act
 
         if not can_act:
             return FallbackDecision(
@@ -86,6 +183,21 @@ class FallbackAI:
             confidence=confidence
         )
 
+    def quick_react(self, game_state: GameStateTuple) -> Optional[FallbackDecision]:
+        """
+        Bagian keputusan yang murah dan mendesak (respon serangan lawan),
+        untuk dijalankan tiap frame di antara keputusan penuh.
+        None berarti tidak ada yang perlu direspon.
+        """
+        if not game_state.can_act or game_state.opp_action not in ATTACK_ACTIONS:
+            return None
+
+        action, reasoning, confidence = self._respond_to_attack(
+            game_state.opp_action, game_state.my_stamina, game_state.distance
+        )
+        return FallbackDecision(action=action, reasoning=reasoning,
+                                trash_talk="", confidence=confidence)
+
     def _decide_action(self, my_health: float, my_stamina: float,
                        opp_health: float, opp_stamina: float,
                        distance: str, distance_px: float,
@@ -93,7 +205,7 @@ class FallbackAI:
         """Core decision logic"""
 
         # CRITICAL: Opponent attacking
-        if opp_action in ['JAB', 'CROSS', 'HOOK', 'UPPERCUT']:
+        if opp_action in ATTACK_ACTIONS:
             return self._respond_to_attack(opp_action, my_stamina, distance)
 
         # DESPERATE: Very low health
@@ -109,20 +221,9 @@ class FallbackAI:
             return (ActionType.IDLE, "Recovering stamina", 0.9)
 
         # DISTANCE BASED
-        if distance == 'far':
-            # Agresif maju, atau jab untuk approach
-            if my_stamina >= 8 and random.random() < 0.7:
-                return (ActionType.JAB, "Approaching with jab", 0.7)
-            return (ActionType.JAB, "Closing distance", 0.6)
-
-        if distance == 'clinch':
-            return self._clinch_action(my_stamina)
-
-        if distance == 'punch':
-            return self._punch_range_action(my_stamina, opp_stamina)
-
-        if distance == 'medium':
-            return self._medium_range_action(my_stamina)
+        distance_action = self._dist_dispatch.get(distance)
+        if distance_action is not None:
+            return distance_action(my_stamina, opp_stamina)
 
         # DEFAULT
         return self._default_action(my_stamina)
@@ -150,45 +251,27 @@ class FallbackAI:
     def _desperate_mode(self, stamina: float, opp_health: float,
                         distance: str) -> Tuple[ActionType, str, float]:
         """Actions when very low health"""
-        # If can finish, go for it
+        # If can finish, go for it; otherwise play safe
         if opp_health < 30 and distance in ['punch', 'clinch']:
-            if stamina >= 35:
-                return (ActionType.UPPERCUT, "Desperate uppercut!", 0.6)
-            if stamina >= 28:
-                return (ActionType.HOOK, "Desperate hook!", 0.6)
-
-        # Otherwise play safe
-        if stamina >= 15:
-            return (ActionType.DODGE, "Survival dodge", 0.7)
-        if stamina >= 12:
-            return (ActionType.BLOCK, "Survival block", 0.7)
-
-        return (ActionType.IDLE, "Desperate recovery", 0.5)
+            return _pick(_DESPERATE_FINISH_TABLE, stamina)
+        return _pick(_DESPERATE_TABLE, stamina)
 
     def _finish_mode(self, stamina: float) -> Tuple[ActionType, str, float]:
         """Actions to finish low health opponent"""
-        if stamina >= 35:
-            return (ActionType.UPPERCUT, "Finish with uppercut!", 0.8)
-        if stamina >= 28:
-            return (ActionType.HOOK, "Finish with hook!", 0.8)
-        if stamina >= 18:
-            return (ActionType.CROSS, "Finish with cross!", 0.8)
-        if stamina >= 8:
-            return (ActionType.JAB, "Finish with jab!", 0.8)
-
-        return (ActionType.IDLE, "Waiting to finish", 0.6)
-
-    def _clinch_action(self, stamina: float) -> Tuple[ActionType, str, float]:
+        return _pick(_FINISH_TABLE, stamina)
+
+    def _far_action(self, stamina: float,
+                    opp_stamina: float) -> Tuple[ActionType, str, float]:
+        """Action at far range"""
+        # Agresif maju, atau jab untuk approach
+        if stamina >= 8 and self._rng.random() < 0.7:
+            return (ActionType.JAB, "Approaching with jab", 0.7)
+        return (ActionType.JAB, "Closing distance", 0.6)
+
+    def _clinch_action(self, stamina: float,
+                       opp_stamina: float) -> Tuple[ActionType, str, float]:
         """Action in clinch range - deterministic"""
-        # Prioritas: uppercut > hook > jab berdasarkan stamina
-        if stamina >= 35:
-            return (ActionType.UPPERCUT, "Clinch uppercut", 0.7)
-        if stamina >= 28:
-            return (ActionType.HOOK, "Short hook", 0.75)
-        if stamina >= 8:
-            return (ActionType.JAB, "Body jab", 0.8)
-
-        return (ActionType.JAB, "Quick jab", 0.6)
+        return _pick(_CLINCH_TABLE, stamina)
 
     def _punch_range_action(self, my_stamina: float,
                             opp_stamina: float) -> Tuple[ActionType, str, float]:
@@ -203,12 +286,10 @@ class FallbackAI:
             return (ActionType.HOOK, "Combo finisher", 0.75)
 
         # Start combo with jab
-        if my_stamina >= 8:
-            return (ActionType.JAB, "Starting combo", 0.7)
-
-        return (ActionType.JAB, "In range attack", 0.7)
+        return _pick(_PUNCH_TABLE, my_stamina)
 
-    def _medium_range_action(self, stamina: float) -> Tuple[ActionType, str, float]:
+    def _medium_range_action(self, stamina: float,
+                             opp_stamina: float) -> Tuple[ActionType, str, float]:
         """Action in medium range - deterministic"""
         if stamina >= 8:
             return (ActionType.JAB, "Range finder jab", 0.75)
@@ -243,14 +324,17 @@ class FallbackAI:
         # Default to jab (lowest cost)
         return ActionType.JAB
 
-    def reset(self):
-        """Reset state"""
+    def reset(self, seed: Optional[int] = None):
+        """Reset state (dan seed RNG kalau diberikan)"""
+        if seed is not None:
+            self._rng.seed(seed)
         self._last_action = None
         self._consecutive_same = 0
         self._combo_sequence.clear()
         self.personality.reset()
 
 
-def create_fallback_ai(personality: str = 'balanced') -> FallbackAI:
+def create_fallback_ai(personality: str = 'balanced',
+                       seed: Optional[int] = None) -> FallbackAI:
     """Factory function untuk FallbackAI"""
-    return FallbackAI(personality)
+    return FallbackAI(personality, seed)
@@ -0,0 +1,110 @@
+"""
+LLM Batcher
+===========
+Kumpulkan request LLM dari beberapa AI controller yang datang hampir
+bersamaan, lalu kirim ke provider sekaligus.
+"""
+
+import asyncio
+from typing import Dict, Any, List, Optional, Set, Tuple
+import sys
+sys.path.insert(0, '..')
+
+from ai.providers.base import BaseLLMProvider, LLMResponse
+
+
+class LLMBatcher:
+    """
+    Shared batcher untuk satu LLM provider.
+    Request yang masuk dalam batch_window detik (atau sampai batch_size)
+    dijalankan bersamaan dengan satu asyncio.gather.
+    """
+
+    def __init__(self, provider: BaseLLMProvider, batch_window: float = 0.02,
+                 batch_size: int = 8):
+        self.provider = provider
+        self.batch_window = batch_window
+        self.batch_size = batch_size
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._sending: Set[asyncio.Task] = set()
+
+        # Stats
+        self.batches_sent = 0
+        self.requests_sent = 0
+
+    async def submit(self, game_state: Dict[str, Any],
+                     personality: str) -> LLMResponse:
+        """Antrikan satu request dan tunggu jawabannya"""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((game_state, personality, future))
+        return await future
+
+    async def _run(self):
+        """Ambil batch dari queue dan kirim ke provider"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+
+            # Tunggu request lain sampai window habis atau batch penuh
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Batch berikutnya tidak menunggu jawaban batch ini
+            task = asyncio.create_task(self._send(batch))
+            self._sending.add(task)
+            task.add_done_callback(self._sending.discard)
+
+    async def _send(self, batch: List[Tuple[Dict[str, Any], str, asyncio.Future]]):
+        """Jalankan satu batch dan bagikan hasilnya ke masing-masing caller"""
+        # Caller yang sudah timeout tidak perlu dikirim lagi
+        batch = [item for item in batch if not item[2].done()]
+        if not batch:
+            return
+
+        self.batches_sent += 1
+        self.requests_sent += len(batch)
+        try:
+            results = await asyncio.gather(
+                *(self.provider.get_action(game_state, personality)
+                  for game_state, personality, _ in batch),
+                return_exceptions=True
+            )
+        except asyncio.CancelledError:
+            # Batcher ditutup; jangan biarkan caller menunggu selamanya
+            for _, _, future in batch:
+                future.cancel()
+            raise
+
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def close(self):
+        """Stop worker; request yang masih antri atau jalan dibatalkan"""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        for task in list(self._sending):
+            task.cancel()
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, _, future = self._queue.get_nowait()
+                future.cancel()
+            self._queue = None
@@ -4,17 +4,19 @@ AI Personality System
 Definisi personality dan behavior patterns untuk AI fighters.
 """
 
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 import random
+from bisect import bisect_right
+import numpy as np
 import sys
 sys.path.insert(0, '..')
 
-from config import PersonalityType, ActionType
+from config import PersonalityType, ActionType, ACTION_DATA, DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PersonalityTraits:
     """Traits untuk personality"""
     aggression: float      # 0.0 - 1.0 (tendency to attack)
@@ -215,15 +217,99 @@ TRASH_TALK: Dict[str, List[str]] = {
 }
 
 
+# Personality descriptions for the LLM prompt
+DESCRIPTIONS: Dict[str, str] = {
+    'destroyer': "Aggressive and powerful. Prefer heavy attacks. Go for the knockout.",
+    'tactician': "Calculated and efficient. Use jabs to set up bigger punches. Be patient.",
+    'ghost': "Evasive and counter-focused. Dodge attacks and strike when they miss.",
+    'wildcard': "Unpredictable and chaotic. Mix up attacks randomly. Keep them guessing.",
+    'balanced': "Well-rounded fighter. Adapt to the situation. Balance offense and defense.",
+    'aggressive': "Relentless attacker. Keep pressure on. Don't let them breathe.",
+    'defensive': "Patient defender. Wait for openings. Counter-attack effectively.",
+}
+
+
+# Urutan action di array weights; index = posisi di tuple ini
+WEIGHT_ACTIONS: Tuple[ActionType, ...] = (
+    ActionType.JAB, ActionType.CROSS, ActionType.HOOK, ActionType.UPPERCUT,
+    ActionType.BLOCK, ActionType.DODGE, ActionType.IDLE,
+)
+JAB_IDX, CROSS_IDX, HOOK_IDX, UPPERCUT_IDX, BLOCK_IDX, DODGE_IDX, IDLE_IDX = range(len(WEIGHT_ACTIONS))
+_LAST_ACTION_IDX = len(WEIGHT_ACTIONS) - 1
+
+# Minimal stamina supaya action boleh dipilih (setengah cost-nya)
+_MIN_STAMINA = np.array([ACTION_DATA[a].stamina_cost * 0.5 for a in WEIGHT_ACTIONS],
+                        dtype=np.float32)
+_STAMINA_STEPS = sorted(set(_MIN_STAMINA.tolist()))
+
+
+def _multiplier(factors: Dict[int, float]) -> np.ndarray:
+    """Vector pengali weights; index yang tidak disebut bernilai 1"""
+    m = np.ones(len(WEIGHT_ACTIONS), dtype=np.float32)
+    for idx, factor in factors.items():
+        m[idx] = factor
+    return m
+
+
+# Pengali per situasi, dipakai sebagai satu perkalian array
+_DESPERATE_AGGRESSIVE = _multiplier({HOOK_IDX: 1.5, UPPERCUT_IDX: 1.5})
+_DESPERATE_DEFENSIVE = _multiplier({BLOCK_IDX: 1.5, DODGE_IDX: 1.5})
+_FINISHER = _multiplier({CROSS_IDX: 1.3, HOOK_IDX: 1.3, UPPERCUT_IDX: 1.4})
+_LOW_STAMINA = _multiplier({JAB_IDX: 1.5, HOOK_IDX: 0.5, UPPERCUT_IDX: 0.3, IDLE_IDX: 2.0})
+_FAR = _multiplier({IDLE_IDX: 1.5, UPPERCUT_IDX: 0.3})
+_CLINCH = _multiplier({UPPERCUT_IDX: 1.5, HOOK_IDX: 1.3, DODGE_IDX: 0.5})
+_EVADE = _multiplier({BLOCK_IDX: 1.5, DODGE_IDX: 1.3})
+_ATTACK_ACTIONS = frozenset({'JAB', 'CROSS', 'HOOK', 'UPPERCUT'})
+
+# Distance yang mengubah weights; distance lain (medium, punch) = 0
+_DIST_FAR, _DIST_CLINCH = 1, 2
+_DISTANCE_BUCKETS = {'far': _DIST_FAR, 'clinch': _DIST_CLINCH}
+
+
+def _situation_key(game_state: Dict[str, Any],
+                   my_stamina: float) -> Tuple[bool, bool, bool, int, bool]:
+    """Kondisi game state yang mempengaruhi action weights"""
+    get = game_state.get
+    return (
+        get('my_health', 100) < 30,
+        get('opp_health', 100) < 30,
+        my_stamina < 30,
+        _DISTANCE_BUCKETS.get(get('distance', 'medium'), 0),
+        get('opp_action', 'idle') in _ATTACK_ACTIONS,
+    )
+
+
 class PersonalityManager:
     """
     Manages personality-based decision making.
     """
 
-    def __init__(self, personality_name: str = 'balanced'):
+    __slots__ = ('personality_name', '_rng', 'traits', '_trash_lines', '_base_weights',
+                 '_weight_table', '_cum_table', '_damage_taken', '_damage_dealt',
+                 '_blocks_successful', '_hits_landed', '_mode')
+
+    def __init__(self, personality_name: str = 'balanced',
+                 rng: Optional[random.Random] = None):
         self.personality_name = personality_name.lower()
+        # RNG per manager (atau milik FallbackAI), bukan module random global
+        self._rng = rng if rng is not None else random.Random()
         self.traits = PERSONALITIES.get(self.personality_name,
                                          PERSONALITIES['balanced'])
+        self._trash_lines = TRASH_TALK.get(self.personality_name,
+                                           TRASH_TALK['balanced'])
+        self._base_weights = np.array([
+            self.traits.jab_weight,
+            self.traits.cross_weight,
+            self.traits.hook_weight,
+            self.traits.uppercut_weight,
+            self.traits.block_weight,
+            self.traits.dodge_weight,
+            0.2,
+        ], dtype=np.float32)
+        # Cache weights final per bucket situasi (lihat _weight_array)
+        self._weight_table: Dict[Tuple[bool, bool, bool, int, bool], np.ndarray] = {}
+        # Cumulative weights setelah filter stamina, per (bucket, stamina step)
+        self._cum_table: Dict[Tuple[Tuple[bool, bool, bool, int, bool], int], List[float]] = {}
 
         # State tracking untuk adaptability
         self._damage_taken = 0
@@ -234,115 +320,106 @@ class PersonalityManager:
 
     def get_action_weights(self, game_state: Dict[str, Any]) -> Dict[ActionType, float]:
         """Get action weights berdasarkan personality dan game state"""
-        weights = {
-            ActionType.JAB: self.traits.jab_weight,
-            ActionType.CROSS: self.traits.cross_weight,
-            ActionType.HOOK: self.traits.hook_weight,
-            ActionType.UPPERCUT: self.traits.uppercut_weight,
-            ActionType.BLOCK: self.traits.block_weight,
-            ActionType.DODGE: self.traits.dodge_weight,
-            ActionType.IDLE: 0.2,
-        }
+        w = self._weight_array(game_state, game_state.get('my_stamina', 100))
+        return dict(zip(WEIGHT_ACTIONS, w.tolist()))
+
+    def _weight_array(self, game_state: Dict[str, Any], my_stamina: float) -> np.ndarray:
+        """Weights (read-only) sebagai array float32 dengan urutan WEIGHT_ACTIONS"""
+        return self._weights_for(_situation_key(game_state, my_stamina))
+
+    def _weights_for(self, key: Tuple[bool, bool, bool, int, bool]) -> np.ndarray:
+        """
+        Semua adjustment hanya bergantung pada beberapa kondisi boolean,
+        jadi hasilnya di-cache per kombinasi kondisi.
+        """
+        w = self._weight_table.get(key)
+        if w is None:
+            w = self._weight_table[key] = self._compute_weights(*key)
+        return w
+
+    def _compute_weights(self, desperate: bool, opp_desperate: bool, low_stamina: bool,
+                         distance: int, opp_attacking: bool) -> np.ndarray:
+        """Hitung weights untuk satu bucket situasi"""
+        w = self._base_weights.copy()
 
         # Adjust based on health
-        my_health = game_state.get('my_health', 100)
-        opp_health = game_state.get('opp_health', 100)
-
-        if my_health < 30:
+        if desperate:
             # Desperate - more aggressive or defensive based on personality
             if self.traits.aggression > 0.6:
-                weights[ActionType.HOOK] *= 1.5
-                weights[ActionType.UPPERCUT] *= 1.5
+                w *= _DESPERATE_AGGRESSIVE
             else:
-                weights[ActionType.BLOCK] *= 1.5
-                weights[ActionType.DODGE] *= 1.5
+                w *= _DESPERATE_DEFENSIVE
 
-        if opp_health < 30:
+        if opp_desperate:
             # Go for the kill
-            weights[ActionType.CROSS] *= 1.3
-            weights[ActionType.HOOK] *= 1.3
-            weights[ActionType.UPPERCUT] *= 1.4
+            w *= _FINISHER
 
         # Adjust based on stamina
-        my_stamina = game_state.get('my_stamina', 100)
-        if my_stamina < 30:
+        if low_stamina:
             # Low stamina - prefer low cost actions
-            weights[ActionType.JAB] *= 1.5
-            weights[ActionType.HOOK] *= 0.5
-            weights[ActionType.UPPERCUT] *= 0.3
-            weights[ActionType.IDLE] *= 2.0
+            w *= _LOW_STAMINA
 
         # Adjust based on distance
-        distance = game_state.get('distance', 'medium')
-        if distance == 'far':
-            weights[ActionType.IDLE] *= 1.5  # Close distance first
-            weights[ActionType.UPPERCUT] *= 0.3
-        elif distance == 'clinch':
-            weights[ActionType.UPPERCUT] *= 1.5
-            weights[ActionType.HOOK] *= 1.3
-            weights[ActionType.DODGE] *= 0.5
+        if distance == _DIST_FAR:
+            w *= _FAR  # Close distance first
+        elif distance == _DIST_CLINCH:
+            w *= _CLINCH
 
         # Adjust based on opponent action
-        opp_action = game_state.get('opp_action', 'idle')
-        if opp_action in ['JAB', 'CROSS', 'HOOK', 'UPPERCUT']:
+        if opp_attacking:
             # Opponent attacking
             if self.traits.patience > 0.6:
-                weights[ActionType.BLOCK] *= 1.5
-                weights[ActionType.DODGE] *= 1.3
+                w *= _EVADE
             else:
                 # Counter attack
-                weights[ActionType.JAB] *= 1.3
+                w[JAB_IDX] *= 1.3
 
-        return weights
+        w.flags.writeable = False
+        return w
 
     def choose_action(self, game_state: Dict[str, Any]) -> ActionType:
         """Choose action berdasarkan weights"""
-        weights = self.get_action_weights(game_state)
-
-        # Filter by stamina
         stamina = game_state.get('my_stamina', 100)
-        from config import ACTION_DATA
-        valid_actions = {}
+        key = _situation_key(game_state, stamina)
 
-        for action, weight in weights.items():
-            action_data = ACTION_DATA.get(action)
-            if action_data and stamina >= action_data.stamina_cost * 0.5:
-                valid_actions[action] = weight
+        # Filter by stamina: action yang boleh dipilih hanya bergantung
+        # pada berapa threshold yang sudah terlewati
+        cum_key = (key, bisect_right(_STAMINA_STEPS, stamina))
+        cum_weights = self._cum_table.get(cum_key)
+        if cum_weights is None:
+            w = np.where(_MIN_STAMINA > stamina, 0.0, self._weights_for(key))
+            cum_weights = self._cum_table[cum_key] = w.cumsum().tolist()
 
-        if not valid_actions:
+        if cum_weights[-1] <= 0:
             return ActionType.IDLE
 
-        # Weighted random choice
-        total = sum(valid_actions.values())
-        r = random.random() * total
-        cumulative = 0
-
-        for action, weight in valid_actions.items():
-            cumulative += weight
-            if r <= cumulative:
-                return action
-
-        return ActionType.IDLE
+        # Weighted random choice (sama dengan random.choices, tanpa list hasil)
+        r = self._rng.random() * cum_weights[-1]
+        return WEIGHT_ACTIONS[bisect_right(cum_weights, r, 0, _LAST_ACTION_IDX)]
 
     def get_trash_talk(self, event: str = 'general') -> str:
         """Get trash talk line"""
-        if random.random() > self.traits.trash_talk_freq:
+        if self._rng.random() > self.traits.trash_talk_freq:
             return ""
 
-        lines = TRASH_TALK.get(self.personality_name,
-                               TRASH_TALK['balanced'])
-        return random.choice(lines)
+        return self._rng.choice(self._trash_lines)
 
     def update_state(self, event: str, value: Any = None):
         """Update internal state untuk adaptability"""
         if event == 'damage_taken':
-            self._damage_taken += value or 0
+            if not value:
+                return
+            self._damage_taken += value
         elif event == 'damage_dealt':
-            self._damage_dealt += value or 0
+            if not value:
+                return
+            self._damage_dealt += value
         elif event == 'block_success':
             self._blocks_successful += 1
         elif event == 'hit_landed':
             self._hits_landed += 1
+        else:
+            return  # Counter tidak berubah, mode juga tidak
 
         # Update mode based on performance
         self._update_mode()
@@ -357,7 +434,6 @@ class PersonalityManager:
         if total_exchanges < 5:
             return  # Not enough data
 
-        hit_ratio = self._hits_landed / max(1, total_exchanges)
         damage_ratio = self._damage_dealt / max(1, self._damage_dealt + self._damage_taken)
 
         if damage_ratio > 0.7:
@@ -367,18 +443,13 @@ class PersonalityManager:
         else:
             self._mode = 'normal'
 
+    def seed(self, seed: Optional[int] = None):
+        """Seed RNG manager ini (untuk match yang bisa di-replay)"""
+        self._rng.seed(seed)
+
     def get_description(self) -> str:
         """Get personality description for LLM prompt"""
-        descs = {
-            'destroyer': "Aggressive and powerful. Prefer heavy attacks. Go for the knockout.",
-            'tactician': "Calculated and efficient. Use jabs to set up bigger punches. Be patient.",
-            'ghost': "Evasive and counter-focused. Dodge attacks and strike when they miss.",
-            'wildcard': "Unpredictable and chaotic. Mix up attacks randomly. Keep them guessing.",
-            'balanced': "Well-rounded fighter. Adapt to the situation. Balance offense and defense.",
-            'aggressive': "Relentless attacker. Keep pressure on. Don't let them breathe.",
-            'defensive': "Patient defender. Wait for openings. Counter-attack effectively.",
-        }
-        return descs.get(self.personality_name, descs['balanced'])
+        return DESCRIPTIONS.get(self.personality_name, DESCRIPTIONS['balanced'])
 
     def reset(self):
         """Reset state untuk match baru"""
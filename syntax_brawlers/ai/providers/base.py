@@ -4,12 +4,58 @@ Base LLM Provider
 Abstract base class untuk semua LLM providers.
 """
 
+import asyncio
+import json
+import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
+import httpx
 
-@dataclass
+from config import DATACLASS_SLOTS
+
+
+# JSON object pertama (tanpa nested) di response LLM
+_JSON_RE = re.compile(r'\{[^{}]*\}', re.DOTALL)
+_VALID_ACTIONS = frozenset(('JAB', 'CROSS', 'HOOK', 'UPPERCUT', 'BLOCK', 'DODGE', 'IDLE'))
+
+# Bagian prompt yang tidak bergantung pada game state
+_PROMPT_ACTIONS_BLOCK = """
+ACTIONS (all attacks MOVE YOU FORWARD):
+- JAB: Fast, 8 dmg, 8 stamina - BEST for closing distance
+- CROSS: Medium, 20 dmg, 18 stamina - Good follow-up after JAB
+- HOOK: Heavy, 32 dmg, 28 stamina - Best at close range
+- UPPERCUT: Massive, 40 dmg, 35 stamina - Best at clinch
+- BLOCK: Reduce damage 70%, 12 stamina - Use vs incoming attack
+- DODGE: Evade attack, 15 stamina - MOVES YOU BACKWARD
+- IDLE: Recover stamina, no movement
+
+TIP: """
+
+_PROMPT_FOOTER = """
+
+Reply ONLY with JSON:
+{"action":"JAB","reasoning":"why","trash_talk":"taunt","confidence":0.8}"""
+
+@lru_cache(maxsize=16)
+def _prompt_header(personality: str) -> str:
+    """Baris pembuka prompt, sekali per personality"""
+    return f"Boxing AI - {personality} style. Pick ONE action.\n\nSTATE:\n"
+
+
+# Distance-specific advice
+_CLINCH_ADVICE = "CLINCH range - UPPERCUT and HOOK do massive damage here!"
+_DISTANCE_ADVICE = {
+    'far': "You are FAR - use JAB to MOVE FORWARD and close distance! Attacks also move you forward.",
+    'medium': "MEDIUM range - JAB or CROSS will hit and move you closer.",
+    'punch': "PUNCH range - all attacks can hit! Use combos: JAB->CROSS->HOOK",
+    'clinch': _CLINCH_ADVICE,
+}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class LLMResponse:
     """Response dari LLM"""
     action: str
@@ -25,6 +71,40 @@ class BaseLLMProvider(ABC):
     Base class untuk LLM providers.
     """
 
+    # Satu HTTP client (keep-alive + connection pool) per event loop, dipakai
+    # bersama semua provider; client httpx terikat ke loop tempat dia dibuat
+    _sessions: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+    MAX_CONNECTIONS = 32
+
+    @classmethod
+    def shared_session(cls) -> httpx.AsyncClient:
+        """HTTP client bersama untuk event loop yang sedang jalan"""
+        loop = asyncio.get_running_loop()
+        sessions = BaseLLMProvider._sessions
+        session = sessions.get(loop)
+        if session is None or session.is_closed:
+            # Loop yang sudah ditutup tidak bisa menutup client-nya lagi
+            for old_loop in [l for l in sessions if l.is_closed()]:
+                del sessions[old_loop]
+            session = httpx.AsyncClient(limits=httpx.Limits(
+                max_connections=cls.MAX_CONNECTIONS,
+                max_keepalive_connections=cls.MAX_CONNECTIONS,
+                keepalive_expiry=60.0
+            ))
+            sessions[loop] = session
+        return session
+
+    @classmethod
+    async def close_session(cls):
+        """Tutup HTTP client bersama milik event loop yang sedang jalan"""
+        session = BaseLLMProvider._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.is_closed:
+            await session.aclose()
+
+    async def ensure_session(self) -> httpx.AsyncClient:
+        """Buat HTTP client bersama sekarang, bukan saat request pertama"""
+        return self.shared_session()
+
     def __init__(self, api_key: str = "", model: str = ""):
         self.api_key = api_key
         self.model = model
@@ -48,54 +128,31 @@ class BaseLLMProvider(ABC):
     def build_prompt(self, game_state: Dict[str, Any],
                      personality: str) -> str:
         """Build prompt untuk LLM"""
-        distance = game_state.get('distance', 'medium')
-
-        # Distance-specific advice
-        if distance == 'far':
-            distance_advice = "You are FAR - use JAB to MOVE FORWARD and close distance! Attacks also move you forward."
-        elif distance == 'medium':
-            distance_advice = "MEDIUM range - JAB or CROSS will hit and move you closer."
-        elif distance == 'punch':
-            distance_advice = "PUNCH range - all attacks can hit! Use combos: JAB->CROSS->HOOK"
-        else:  # clinch
-            distance_advice = "CLINCH range - UPPERCUT and HOOK do massive damage here!"
-
-        return f"""Boxing AI - {personality} style. Pick ONE action.
-
-STATE:
-- My HP: {int(game_state.get('my_health', 100))}% | Stamina: {int(game_state.get('my_stamina', 100))}%
-- Enemy HP: {int(game_state.get('opp_health', 100))}% | Stamina: {int(game_state.get('opp_stamina', 100))}%
-- Distance: {distance} | Enemy doing: {game_state.get('opp_action', 'idle')}
-
-ACTIONS (all attacks MOVE YOU FORWARD):
-- JAB: Fast, 8 dmg, 8 stamina - BEST for closing distance
-- CROSS: Medium, 20 dmg, 18 stamina - Good follow-up after JAB
-- HOOK: Heavy, 32 dmg, 28 stamina - Best at close range
-- UPPERCUT: Massive, 40 dmg, 35 stamina - Best at clinch
-- BLOCK: Reduce damage 70%, 12 stamina - Use vs incoming attack
-- DODGE: Evade attack, 15 stamina - MOVES YOU BACKWARD
-- IDLE: Recover stamina, no movement
-
-TIP: {distance_advice}
-
-Reply ONLY with JSON:
-{{"action":"JAB","reasoning":"why","trash_talk":"taunt","confidence":0.8}}"""
+        get = game_state.get
+        distance = get('distance', 'medium')
+
+        # Hanya bagian STATE yang berubah; sisanya string konstan
+        return "".join((
+            _prompt_header(personality),
+            f"- My HP: {int(get('my_health', 100))}% | Stamina: {int(get('my_stamina', 100))}%\n"
+            f"- Enemy HP: {int(get('opp_health', 100))}% | Stamina: {int(get('opp_stamina', 100))}%\n"
+            f"- Distance: {distance} | Enemy doing: {get('opp_action', 'idle')}\n",
+            _PROMPT_ACTIONS_BLOCK,
+            _DISTANCE_ADVICE.get(distance, _CLINCH_ADVICE),
+            _PROMPT_FOOTER,
+        ))
 
     def parse_response(self, response: str) -> LLMResponse:
         """Parse LLM response ke LLMResponse"""
-        import json
-        import re
-
         try:
             # Try multiple JSON extraction patterns
             # Pattern 1: Simple JSON object
-            json_match = re.search(r'\{[^{}]*\}', response, re.DOTALL)
+            json_match = _JSON_RE.search(response)
             if json_match:
                 data = json.loads(json_match.group())
                 action = data.get('action', 'IDLE').upper().strip()
                 # Validate action
-                valid_actions = ['JAB', 'CROSS', 'HOOK', 'UPPERCUT', 'BLOCK', 'DODGE', 'IDLE']
-                if action not in valid_actions:
+                if action not in _VALID_ACTIONS:
                     action = 'IDLE'
                 return LLMResponse(
                     action=action,
@@ -108,8 +165,7 @@ Reply ONLY with JSON:
             # Pattern 2: Try full response as JSON
             data = json.loads(response.strip())
             action = data.get('action', 'IDLE').upper().strip()
-            valid_actions = ['JAB', 'CROSS', 'HOOK', 'UPPERCUT', 'BLOCK', 'DODGE', 'IDLE']
-            if action not in valid_actions:
+            if action not in _VALID_ACTIONS:
                 action = 'IDLE'
             return LLMResponse(
                 action=action,
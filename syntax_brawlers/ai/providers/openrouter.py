@@ -48,6 +48,10 @@ class OpenRouterProvider(BaseLLMProvider):
         self._response_cache: Dict[str, LLMResponse] = {}
         self._cache_ttl = 2.0  # Cache untuk 2 detik
 
+        # Event loop untuk versi sync; dipakai ulang supaya HTTP client bersama
+        # (dan koneksi keep-alive-nya) tetap hidup antar panggilan
+        self._sync_loop: Optional[asyncio.AbstractEventLoop] = None
+
     async def check_availability(self) -> bool:
         """Check apakah API available"""
         if not self.api_key:
@@ -56,20 +60,20 @@ class OpenRouterProvider(BaseLLMProvider):
             return False
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://openrouter.ai/api/v1/models",
-                    headers={"Authorization": f"Bearer {self.api_key}"},
-                    timeout=5.0
-                )
+            client = self.shared_session()
+            response = await client.get(
+                "https://openrouter.ai/api/v1/models",
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=5.0
+            )
 
-                if response.status_code == 200:
-                    self.is_available = True
-                    return True
-                else:
-                    self.last_error = f"API returned status {response.status_code}"
-                    self.is_available = False
-                    return False
+            if response.status_code == 200:
+                self.is_available = True
+                return True
+            else:
+                self.last_error = f"API returned status {response.status_code}"
+                self.is_available = False
+                return False
 
         except Exception as e:
             self.last_error = str(e)
@@ -119,46 +123,46 @@ class OpenRouterProvider(BaseLLMProvider):
         # Make request with retries
         for attempt in range(LLM_MAX_RETRIES + 1):
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        self.API_URL,
-                        headers=self.headers,
-                        json=payload,
-                        timeout=LLM_TIMEOUT
+                client = self.shared_session()
+                response = await client.post(
+                    self.API_URL,
+                    headers=self.headers,
+                    json=payload,
+                    timeout=LLM_TIMEOUT
+                )
+
+                if response.status_code == 200:
+                    data = response.json()
+                    content = data['choices'][0]['message']['content']
+                    result = self.parse_response(content)
+
+                    # Cache result
+                    self._response_cache[cache_key] = result
+                    self.is_available = True
+
+                    return result
+
+                elif response.status_code == 401:
+                    # Print debug info
+                    error_body = response.text
+                    print(f"[OpenRouter] 401 Error - API Key: {self.api_key[:20]}...{self.api_key[-4:]}")
+                    print(f"[OpenRouter] Response: {error_body}")
+                    self.last_error = f"Auth failed: {error_body}"
+                    return LLMResponse(
+                        action='IDLE',
+                        reasoning="Auth failed",
+                        trash_talk="",
+                        confidence=0,
+                        error=f"Auth failed: {error_body}"
                     )
 
-                    if response.status_code == 200:
-                        data = response.json()
-                        content = data['choices'][0]['message']['content']
-                        result = self.parse_response(content)
-
-                        # Cache result
-                        self._response_cache[cache_key] = result
-                        self.is_available = True
-
-                        return result
-
-                    elif response.status_code == 401:
-                        # Print debug info
-                        error_body = response.text
-                        print(f"[OpenRouter] 401 Error - API Key: {self.api_key[:20]}...{self.api_key[-4:]}")
-                        print(f"[OpenRouter] Response: {error_body}")
-                        self.last_error = f"Auth failed: {error_body}"
-                        return LLMResponse(
-                            action='IDLE',
-                            reasoning="Auth failed",
-                            trash_talk="",
-                            confidence=0,
-                            error=f"Auth failed: {error_body}"
-                        )
-
-                    elif response.status_code == 429:
-                        # Rate limited, wait and retry
-                        await asyncio.sleep(1.0 * (attempt + 1))
-                        continue
-
-                    else:
-                        self.last_error = f"API error: {response.status_code}"
+                elif response.status_code == 429:
+                    # Rate limited, wait and retry
+                    await asyncio.sleep(1.0 * (attempt + 1))
+                    continue
+
+                else:
+                    self.last_error = f"API error: {response.status_code}"
 
             except httpx.TimeoutException:
                 self.last_error = "Request timed out"
@@ -223,13 +227,7 @@ class OpenRouterProvider(BaseLLMProvider):
                         personality: str) -> LLMResponse:
         """Synchronous version of get_action"""
         try:
-            # Run async in event loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(self.get_action(game_state, personality))
-            finally:
-                loop.close()
+            return self._run_sync(self.get_action(game_state, personality))
         except Exception as e:
             return LLMResponse(
                 action='JAB',  # Default action instead of IDLE
@@ -242,15 +240,27 @@ class OpenRouterProvider(BaseLLMProvider):
     def check_availability_sync(self) -> bool:
         """Synchronous version of check_availability"""
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(self.check_availability())
-            finally:
-                loop.close()
+            return self._run_sync(self.check_availability())
         except:
             return False
 
+    def _run_sync(self, coro):
+        """Jalankan coroutine di event loop sync milik provider ini"""
+        if self._sync_loop is None or self._sync_loop.is_closed():
+            self._sync_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._sync_loop)
+        return self._sync_loop.run_until_complete(coro)
+
+    def close(self):
+        """Tutup event loop sync beserta HTTP client yang dibuat di sana"""
+        loop = self._sync_loop
+        if loop is None or loop.is_closed():
+            return
+        if loop in BaseLLMProvider._sessions:
+            loop.run_until_complete(BaseLLMProvider.close_session())
+        loop.close()
+        self._sync_loop = None
+
 
 # Convenience function untuk quick setup
 def create_openrouter_provider(api_key: str = "",
@@ -4,10 +4,14 @@ Syntax Brawlers v2.0 - Configuration & Constants
 All game settings, colors, and constants in one place.
 """
 
+import sys
 from enum import Enum, auto
 from dataclasses import dataclass
 from typing import Tuple, Dict, Any
 
+# Keyword untuk @dataclass(**DATACLASS_SLOTS): slots=True baru ada di Python 3.10
+DATACLASS_SLOTS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 # =============================================================================
 # DISPLAY SETTINGS
 # =============================================================================
@@ -399,6 +403,8 @@ KO_COUNT = 10  # 10-count for knockdown
 LLM_TIMEOUT = 10.0  # seconds
 LLM_MAX_RETRIES = 2
 LLM_DEFAULT_MODEL = "z-ai/glm-4.6"
+LLM_CACHE_SIZE = 512  # cached responses per AI controller
+LLM_HEDGE_DELAY = 0.1  # seconds to wait for the LLM before using the fallback AI
 
 # =============================================================================
 # AUDIO SETTINGS
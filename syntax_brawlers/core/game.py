@@ -16,6 +16,7 @@ from config import (
 )
 from core.state_machine import StateMachine
 from core.input_handler import InputHandler
+from ai.providers.base import BaseLLMProvider
 
 
 class Game:
@@ -221,6 +222,12 @@ class Game:
 
     def _cleanup(self):
         """Clean up resources"""
+        for ai in self.ai_controllers:
+            if hasattr(ai, 'shutdown'):
+                ai.shutdown()
+            provider = getattr(ai, 'llm_provider', None)
+            if hasattr(provider, 'close'):
+                provider.close()
         if self.audio_available:
             pygame.mixer.quit()
         pygame.quit()
@@ -538,6 +545,8 @@ class AsyncGame(Game):
             # Yield to event loop
             await asyncio.sleep(0)
 
+        # HTTP client bersama dibuat di loop ini; tutup selagi loop masih jalan
+        await BaseLLMProvider.close_session()
         self._cleanup()
 
     async def _update_async(self):
@@ -575,15 +584,14 @@ class AsyncGame(Game):
             # Update round timer
             self.round_timer -= dt
 
-            # Async AI decisions
-            for i, ai in enumerate(self.ai_controllers):
-                if ai and self.fighters:
-                    # Non-blocking AI call
-                    action = await ai.get_action_async(
-                        self.fighters[i],
-                        self.fighters[1 - i],
-                        self.round_timer
-                    )
+            # Async AI decisions, both fighters at once
+            if self.fighters:
+                deciding = [(i, ai) for i, ai in enumerate(self.ai_controllers) if ai]
+                actions = await asyncio.gather(*(
+                    ai.get_action_async(self.fighters[i], self.fighters[1 - i], self.round_timer)
+                    for i, ai in deciding
+                ))
+                for (i, _), action in zip(deciding, actions):
                     if action:
                         self.fighters[i].execute_action(action)
 
@@ -9,6 +9,7 @@ Jalankan: python main.py
 
 import sys
 import os
+import logging
 
 # Tambahkan path untuk imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -21,6 +22,9 @@ from config import (
 
 def main():
     """Entry point utama"""
+    # Log AI (LLM error, timeout) tampil seperti print biasa; pakai DEBUG untuk tiap keputusan
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     print(f"\n{'='*60}")
     print(f"  {GAME_TITLE}")
     print(f"{'='*60}\n")